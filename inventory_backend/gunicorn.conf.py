@@ -0,0 +1,26 @@
+import os
+
+wsgi_app = "inventory_backend.wsgi:application"
+
+# Keep numba's compiled functions somewhere that survives redeploys of the code
+# directory; point this at a persistent volume in production.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", os.path.join(os.path.dirname(__file__), ".numba_cache")
+)
+
+
+def post_worker_init(worker):
+    """Runs every forecasting path once before the worker accepts requests.
+
+    Loads Prophet's Stan model, fits statsmodels' first ARIMA and compiles the numba kernels, so
+    no request after a deploy pays for them.
+
+    Args:
+        worker (gunicorn.workers.base.Worker): The worker that finished loading the application.
+
+    Returns:
+        None"""
+    from products.forecast import warm_up
+
+    worker.log.info("Warming up forecasting models")
+    warm_up()
@@ -0,0 +1,27 @@
+import os
+
+from celery import Celery
+from celery.signals import worker_process_init
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "inventory_backend.settings")
+
+app = Celery("inventory_backend")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def warm_up_forecasting(**kwargs):
+    """Runs every forecasting path once in each forked worker process when STORER_FORECAST_WARMUP is set.
+
+    Args:
+        **kwargs: Signal arguments (unused).
+
+    Returns:
+        None"""
+    from django.conf import settings
+
+    if settings.STORER_FORECAST_WARMUP:
+        from products.forecast import warm_up
+
+        warm_up()
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 from dotenv import load_dotenv
 import os
+import sys
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -75,6 +76,10 @@ REST_FRAMEWORK = {
     ],
 
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    'DEFAULT_RENDERER_CLASSES': [
+        'products.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 from datetime import timedelta
@@ -121,6 +126,7 @@ WSGI_APPLICATION = 'inventory_backend.wsgi.application'
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 
 DATABASES = {
     'default': {
@@ -130,9 +136,67 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='3308'),
+        # Template for `manage.py test --parallel`, which clones it per worker
+        # (test_<name>_1, test_<name>_2, ...).
+        'TEST': {
+            'NAME': config('DB_TEST_NAME', default='test_' + config('DB_NAME', default='keshav')),
+        },
     }
 }
 
+# Rows per statement for bulk_create/bulk_update in management commands.
+# ~1k is near-optimal on PostgreSQL; MySQL/MariaDB tolerate 10k+ if
+# max_allowed_packet is raised accordingly.
+STORER_BULK_BATCH_SIZE = config('STORER_BULK_BATCH_SIZE', default=500, cast=int)
+
+# Fit each forecasting model once in every Celery worker process
+# (worker_process_init, inventory_backend/celery.py) so its first task does not
+# pay for Stan/statsmodels/numba initialisation. Gunicorn workers are warmed by
+# the post_worker_init hook in gunicorn.conf.py. Nothing warms up in
+# AppConfig.ready(), which also runs for migrate, management commands and the
+# Celery prefork parent.
+STORER_FORECAST_WARMUP = config('STORER_FORECAST_WARMUP', default=False, cast=bool)
+
+# Caching: Redis when REDIS_URL is set, otherwise a per-process memory cache.
+if config('REDIS_URL', default=''):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': config('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Celery runs the forecast/backtest tasks queued with '?async=true'. Without a
+# broker, tasks execute inline and their results are kept in process memory.
+# With one, the web process polls results written by the workers, so they must
+# go to a shared backend: Redis when REDIS_URL is set, otherwise set
+# CELERY_RESULT_BACKEND explicitly.
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='')
+CELERY_RESULT_BACKEND = config(
+    'CELERY_RESULT_BACKEND', default=config('REDIS_URL', default='') or 'cache+memory://'
+)
+if CELERY_BROKER_URL and CELERY_RESULT_BACKEND.startswith('cache+memory'):
+    raise ImproperlyConfigured(
+        'CELERY_BROKER_URL is set but CELERY_RESULT_BACKEND is in-process memory; '
+        'set CELERY_RESULT_BACKEND or REDIS_URL to a shared backend.'
+    )
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+CELERY_TASK_STORE_EAGER_RESULT = True
+# Model fits are CPU-bound and slow: keep them on their own queue, served by
+# `celery -A inventory_backend worker -Q forecast --concurrency=<cores>`, and
+# let each worker process reserve one task at a time.
+CELERY_TASK_ROUTES = {'products.tasks.run_*': {'queue': 'forecast'}}
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# The forecast warm-up runs in worker_process_init, which Celery otherwise
+# aborts after 4 seconds.
+CELERY_WORKER_PROC_ALIVE_TIMEOUT = 120
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -151,6 +215,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Test runs only: MD5 makes creating users in fixtures cheap. Never use in production.
+if 'test' in sys.argv or os.environ.get('DJANGO_TEST'):
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+    STORER_FORECAST_WARMUP = False
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -8,7 +8,7 @@ from users.views import UserViewSet
 import ai_assistant.urls
 from inventory_logs.views import InventoryViewSet
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from products.views import get_demand_forecast, get_arima_demand_forecast, get_prophet_backtesting, get_arima_backtesting, get_dashboard_metrics, get_sales_profit_trend
+from products.views import get_demand_forecast, get_arima_demand_forecast, get_bulk_arima_demand_forecast, get_prophet_backtesting, get_arima_backtesting, get_forecast_result, get_dashboard_metrics, get_sales_profit_trend
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 # Initialize the router for REST API routes
 router = routers.DefaultRouter()
@@ -31,10 +31,12 @@ urlpatterns = [
     # JWT authentication routes
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('api/products/forecast/arima/bulk/', get_bulk_arima_demand_forecast, name='product_arima_forecast_bulk'),
     path('api/products/<str:product_sku>/forecast/prophet/<int:horizon>/', get_demand_forecast, name='product_forecast'), # Prophet endpoint -  URL updated to be more descriptive # URL updated
     path('api/products/<str:product_sku>/forecast/arima/<int:horizon>/', get_arima_demand_forecast, name='product_arima_forecast'), # New ARIMA endpoint # New ARIMA endpoint
     path('api/products/<str:product_sku>/backtest/prophet/<int:validation_horizon>/', get_prophet_backtesting, name='product_prophet_backtest'),
     path('api/products/<str:product_sku>/backtest/arima/<int:validation_horizon>/', get_arima_backtesting, name='product_arima_backtest'),
+    path('api/forecast/result/<str:task_id>/', get_forecast_result, name='forecast_result'),
     path('api/metrics/', get_dashboard_metrics, name='dashboard_metrics'),
     path('api/sales_profit_trend/', get_sales_profit_trend, name='sales_profit_trend'),
     path('api/ai/', include('ai_assistant.urls')),  # New URL
@@ -0,0 +1,36 @@
+# Generated by Django 5.1 on 2026-10-15 18:05
+
+from django.db import migrations, models
+
+
+def backfill_reason_codes(apps, schema_editor):
+    InventoryLog = apps.get_model("inventory_logs", "InventoryLog")
+    InventoryLog.objects.filter(reason__istartswith="sale").update(reason_code="sale")
+    InventoryLog.objects.filter(reason__istartswith="purchase").update(
+        reason_code="purchase"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory_logs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inventorylog",
+            name="reason_code",
+            field=models.CharField(
+                choices=[
+                    ("sale", "Sale"),
+                    ("purchase", "Purchase"),
+                    ("adjustment", "Adjustment"),
+                ],
+                db_index=True,
+                default="adjustment",
+                max_length=10,
+            ),
+        ),
+        migrations.RunPython(backfill_reason_codes, migrations.RunPython.noop),
+    ]
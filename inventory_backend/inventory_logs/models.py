@@ -4,8 +4,22 @@ from django.contrib.auth import get_user_model
 
 
 class InventoryLog(models.Model):
+    REASON_CODES = [
+        ("sale", "Sale"),
+        ("purchase", "Purchase"),
+        ("adjustment", "Adjustment"),
+    ]
+    # Formatted on read, so the write path stores only the code and the quantity.
+    REASON_TEMPLATES = {
+        "sale": "Sale of {units} units",
+        "purchase": "Purchase of {units} units",
+        "adjustment": "Adjustment of {change} units",
+    }
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     stock_change = models.IntegerField()
+    reason_code = models.CharField(
+        max_length=10, choices=REASON_CODES, default="adjustment", db_index=True
+    )
     reason = models.CharField(max_length=255, blank=True, null=True, default="")
     change_date = models.DateTimeField(auto_now_add=True)
     source = models.CharField(max_length=255, blank=True, null=True, default="")
@@ -26,5 +40,17 @@ class InventoryLog(models.Model):
             f"Change: {self.stock_change} for {self.product.name} on {self.change_date}"
         )
 
+    @property
+    def description(self):
+        """Returns the free-text reason if one was given, otherwise one built from the reason code.
+
+        Returns:
+            str: E.g. "Sale of 4 units"."""
+        if self.reason:
+            return self.reason
+        return self.REASON_TEMPLATES[self.reason_code].format(
+            units=abs(self.stock_change), change=self.stock_change
+        )
+
     class Meta:
         db_table = "Inventory_logs"
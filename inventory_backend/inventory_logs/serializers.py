@@ -2,6 +2,8 @@ from rest_framework import serializers
 from .models import InventoryLog
 
 class InventorySerializer(serializers.ModelSerializer):
+    description = serializers.CharField(read_only=True)
+
     class Meta:
         model = InventoryLog
         fields = '__all__'
\ No newline at end of file
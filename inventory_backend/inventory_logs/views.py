@@ -1,8 +1,11 @@
+from django.core.cache import cache
+from django.db.models import F
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from .models import InventoryLog
 from .serializers import InventorySerializer
 from products.models import Product
+from products.signals import invalidate_product_list, product_cache_key
 
 
 class InventoryViewSet(viewsets.ModelViewSet):
@@ -30,13 +33,18 @@ class InventoryViewSet(viewsets.ModelViewSet):
                 {"error": "Product ID is required"}, status=status.HTTP_400_BAD_REQUEST
             )
         try:
-            product = Product.objects.get(id=product_id)
+            product = Product.objects.only("id", "sku").get(id=product_id)
         except Product.DoesNotExist:
             return Response(
                 {"error": "Product not found"}, status=status.HTTP_404_NOT_FOUND
             )
-        product.stock_level += stock_change
-        product.save()
+        # A single UPDATE, so concurrent adjustments and sales cannot overwrite each
+        # other's change; it bypasses the Product signals that drop cached copies.
+        Product.objects.filter(pk=product.pk).update(
+            stock_level=F("stock_level") + stock_change
+        )
+        cache.delete(product_cache_key(product.sku))
+        invalidate_product_list()
         inventory_log = InventoryLog.objects.create(
             product=product, stock_change=stock_change, reason=reason
         )
@@ -0,0 +1,13 @@
+import factory
+from .models import Product
+
+
+class ProductFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Product
+
+    name = factory.Sequence(lambda n: f"Test Product {n}")
+    description = "Test Description"
+    price = 10.99
+    stock_level = 100
+    category = "Test Category"
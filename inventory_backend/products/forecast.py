@@ -1,4 +1,11 @@
+import os
+
+# Persist StatsForecast's numba-compiled models in __pycache__ across restarts.
+os.environ.setdefault("NIXTLA_NUMBA_CACHE", "1")
+
 from prophet import Prophet
+from statsforecast import StatsForecast
+from statsforecast.models import AutoARIMA
 import pandas as pd
 import logging
 from statsmodels.tsa.arima.model import ARIMA
@@ -8,15 +15,76 @@ from statsmodels.tools.sm_exceptions import (
     ConvergenceWarning,
 )
 import warnings
-from sklearn.metrics import mean_absolute_error, mean_squared_error
+from functools import lru_cache
 import numpy as np
 
+from .forecast_fast import forecast_demand_holt_winters, njit
+
 logger = logging.getLogger(__name__)
 warnings.simplefilter("ignore", ValueWarning)
 warnings.simplefilter("ignore", HessianInversionWarning)
 warnings.simplefilter("ignore", ConvergenceWarning)
 
 
+def forecast_records(forecast):
+    """Converts a forecast DataFrame into the list of {'ds', 'yhat'} dicts the API returns.
+
+    Both columns are converted in one vectorized pass each, with dates formatted as ISO 8601
+    strings, instead of walking rows with DataFrame.to_dict('records').
+
+    Args:
+        forecast (pandas.DataFrame): A DataFrame with datetime 'ds' and numeric 'yhat' columns.
+
+    Returns:
+        list of dict: One {'ds': str, 'yhat': float} dict per forecast row."""
+    ds = pd.to_datetime(forecast["ds"]).dt.strftime("%Y-%m-%dT%H:%M:%S").tolist()
+    yhat = forecast["yhat"].to_numpy(dtype=np.float64).tolist()
+    return [{"ds": day, "yhat": value} for day, value in zip(ds, yhat)]
+
+
+@njit(cache=True)
+def _error_metrics(actual, forecast):
+    """Computes MAE and RMSE over the points where the forecast is finite.
+
+    Args:
+        actual (numpy.ndarray): Observed values, as float64.
+        forecast (numpy.ndarray): Forecast values aligned with `actual`, as float64.
+
+    Returns:
+        tuple: (mae, rmse, count); both errors are NaN when `count` is 0."""
+    abs_sum = 0.0
+    sq_sum = 0.0
+    count = 0
+    for i in range(actual.shape[0]):
+        if np.isfinite(forecast[i]):
+            err = actual[i] - forecast[i]
+            abs_sum += abs(err)
+            sq_sum += err * err
+            count += 1
+    if count == 0:
+        return np.nan, np.nan, 0
+    return abs_sum / count, np.sqrt(sq_sum / count), count
+
+
+def _backtest_metrics(actual, forecast):
+    """Wraps _error_metrics for the backtest responses.
+
+    Args:
+        actual (array-like): Observed values for the validation period.
+        forecast (array-like): Forecast values for the validation period.
+
+    Returns:
+        tuple: The metrics dict ('mae' and 'rmse', or "NaN" strings when no forecast point is
+            finite) followed by the raw MAE and RMSE floats for logging."""
+    mae, rmse, count = _error_metrics(
+        np.ascontiguousarray(actual, dtype=np.float64),
+        np.ascontiguousarray(forecast, dtype=np.float64),
+    )
+    if not count:
+        return {"mae": "NaN", "rmse": "NaN"}, mae, rmse
+    return {"mae": mae, "rmse": rmse}, mae, rmse
+
+
 def forecast_demand_prophet(product_sku, historical_data, horizon):
     """Generates a demand forecast for a given product using Facebook Prophet.
 
@@ -27,7 +95,7 @@ def forecast_demand_prophet(product_sku, historical_data, horizon):
         horizon (int): Number of future periods (days) to forecast demand for.
 
     Returns:
-        list of dict: A list of dictionaries each containing 'ds' (forecast date as Timestamp)
+        list of dict: A list of dictionaries each containing 'ds' (forecast date as an ISO 8601 string)
             and 'yhat' (predicted demand) for the forecast horizon. Returns an empty list if
             forecasting fails.
 
@@ -44,7 +112,7 @@ def forecast_demand_prophet(product_sku, historical_data, horizon):
         future = model.make_future_dataframe(periods=horizon)
         forecast = model.predict(future)
         forecast = forecast[forecast["ds"] > df["ds"].max()]
-        return forecast[["ds", "yhat"]].to_dict("records")
+        return forecast_records(forecast)
     except Exception as e:
         logger.error(
             f"Prophet forecasting failed for SKU: {product_sku}. Error: {e}",
@@ -53,14 +121,87 @@ def forecast_demand_prophet(product_sku, historical_data, horizon):
         return []
 
 
-def forecast_demand_arima(product_sku, historical_data, horizon, arima_order=(5, 1, 0)):
+def forecast_demand_statsforecast(product_sku, historical_data, horizon):
+    """Generates a daily demand forecast for a product with StatsForecast's AutoARIMA.
+
+    AutoARIMA picks its own order and a weekly seasonality. Its numba-compiled fit is much faster
+    than Prophet, which makes it the default model of the demand forecast endpoint.
+
+    Args:
+        product_sku (str): The SKU identifier for the product being forecasted.
+        historical_data (pandas.DataFrame): DataFrame containing 'transaction_date' and 'quantity' columns.
+        horizon (int): Number of future days to forecast demand for.
+
+    Returns:
+        list of dict: A list of dictionaries each containing 'ds' (forecast date as an ISO 8601 string)
+            and 'yhat' (predicted demand). Returns an empty list if forecasting fails."""
+    try:
+        df = historical_data[["transaction_date", "quantity"]].rename(
+            columns={"transaction_date": "ds", "quantity": "y"}
+        )
+        df = df.groupby(pd.Grouper(key="ds", freq="D"))["y"].sum().reset_index()
+        df["unique_id"] = product_sku
+        model = StatsForecast(models=[AutoARIMA(season_length=7)], freq="D")
+        forecast = model.forecast(df=df, h=horizon).reset_index()
+        forecast = forecast.rename(columns={"AutoARIMA": "yhat"})
+        return forecast_records(forecast)
+    except Exception as e:
+        logger.error(
+            f"StatsForecast forecasting failed for SKU: {product_sku}. Error: {e}",
+            exc_info=True,
+        )
+        return []
+
+
+def _daily_series(ds, y):
+    """Sums quantities into one value per calendar day, with zeros on days without demand.
+
+    Args:
+        ds (numpy.ndarray): Observation dates, oldest first, as datetime64 values.
+        y (numpy.ndarray): Quantities aligned with `ds`.
+
+    Returns:
+        tuple: The first day as numpy.datetime64[D] and the daily totals as a float64 array."""
+    days = ds.astype("datetime64[D]")
+    start = days[0]
+    offsets = (days - start).astype(np.int64)
+    values = np.zeros(offsets[-1] + 1)
+    np.add.at(values, offsets, y)
+    return start, values
+
+
+def _fit_arima(product_sku, values, arima_order):
+    """Fits an ARIMA model to a daily series, reusing an earlier fit of identical data and order.
+
+    Args:
+        product_sku (str): The SKU identifier of the product, kept in the cache key for traceability.
+        values (numpy.ndarray): Daily demand values over contiguous days.
+        arima_order (tuple of int): The (p, d, q) order parameters for the ARIMA model.
+
+    Returns:
+        ARIMAResults: The fitted model."""
+    return _fit_arima_cached(product_sku, tuple(arima_order), tuple(values.tolist()))
+
+
+@lru_cache(maxsize=128)
+def _fit_arima_cached(product_sku, arima_order, values):
+    """Fits ARIMA on the series values; memoized on those arguments.
+
+    Keying on the series content means new transactions change the key, so stale fits are never returned."""
+    return ARIMA(np.asarray(values), order=arima_order).fit()
+
+
+def forecast_demand_arima(product_sku, ds, y, horizon, arima_order=(5, 1, 0)):
     """Generates a daily demand forecast for a product SKU using an ARIMA time series model.
 
-    Aggregates historical transaction data by day to handle duplicate transaction dates, fits an ARIMA model to the aggregated time series, and forecasts demand over a given horizon.
+    Sums the observations by day, fits an ARIMA model to the daily series, and forecasts demand
+    over a given horizon. The history is taken as plain NumPy arrays, since statsmodels fits on
+    those directly.
 
     Args:
         product_sku (str): The SKU identifier for the product to forecast.
-        historical_data (pandas.DataFrame): Historical transaction data containing at least 'transaction_date' and 'quantity' columns.
+        ds (numpy.ndarray): Observation dates, oldest first, as datetime64 values.
+        y (numpy.ndarray): Quantities aligned with `ds`.
         horizon (int): Number of future days to forecast.
         arima_order (tuple of int, optional): The (p, d, q) order parameters for the ARIMA model. Defaults to (5, 1, 0).
 
@@ -70,26 +211,22 @@ def forecast_demand_arima(product_sku, historical_data, horizon, arima_order=(5,
     Raises:
         Exception: Propagates any exceptions encountered during model fitting or forecasting."""
     logger.info(
-        f"Generating ARIMA forecast for product SKU: {product_sku}, horizon: {horizon}, ARIMA order: {arima_order}"
-    )
-    df = historical_data[["transaction_date", "quantity"]].rename(
-        columns={"transaction_date": "ds", "quantity": "y"}
+        "Generating ARIMA forecast for product SKU: %s, horizon: %s, ARIMA order: %s",
+        product_sku,
+        horizon,
+        arima_order,
     )
-    daily_df = df.groupby(pd.Grouper(key="ds", freq="D")).sum().reset_index()
-    ts = daily_df.set_index("ds")["y"].asfreq("D")
-    ts = ts.fillna(method="ffill")
-    logger.info(
-        f"Time Series Data after Daily Aggregation - Shape: {ts.shape}, First 10 Dates: {ts.head(10).index.to_list()}"
+    start, values = _daily_series(ds, y)
+    logger.debug(
+        "Daily series for SKU %s: %d days from %s", product_sku, len(values), start
     )
     try:
-        model = ARIMA(ts, order=arima_order)
-        model_fit = model.fit()
+        model_fit = _fit_arima(product_sku, values, arima_order)
         forecast_values = model_fit.forecast(steps=horizon)
-        forecast_dates = pd.date_range(start=ts.index[-1], periods=horizon, freq="D")
-        forecast_df = pd.DataFrame(
-            {"ds": forecast_dates, "yhat": forecast_values.values}
+        forecast_dates = pd.date_range(
+            start=start + len(values) - 1, periods=horizon, freq="D"
         )
-        return forecast_df[["ds", "yhat"]]
+        return pd.DataFrame({"ds": forecast_dates, "yhat": forecast_values})
     except Exception as e:
         logger.error(
             f"ARIMA Forecasting error for SKU {product_sku}: {e}", exc_info=True
@@ -97,6 +234,27 @@ def forecast_demand_arima(product_sku, historical_data, horizon, arima_order=(5,
         raise e
 
 
+def forecast_arima_records(product_sku, ds, y, horizon, arima_order):
+    """Runs forecast_demand_arima and captures failures, for use in a joblib worker.
+
+    Args:
+        product_sku (str): The SKU identifier for the product to forecast.
+        ds (numpy.ndarray): Observation dates, oldest first, as datetime64 values.
+        y (numpy.ndarray): Quantities aligned with `ds`.
+        horizon (int): Number of future days to forecast.
+        arima_order (tuple of int): The (p, d, q) order parameters for the ARIMA model.
+
+    Returns:
+        tuple: (records, None) with the forecast as a list of dicts on success, or (None, message)."""
+    try:
+        forecast = forecast_demand_arima(
+            product_sku, ds, y, horizon, arima_order=arima_order
+        )
+        return forecast_records(forecast), None
+    except Exception as e:
+        return None, f"ARIMA forecasting failed: {str(e)}"
+
+
 def backtest_prophet_forecast(product_sku, historical_data, validation_horizon):
     """Backtests a Prophet time series forecasting model on historical product sales data.
 
@@ -145,33 +303,27 @@ def backtest_prophet_forecast(product_sku, historical_data, validation_horizon):
         logger.error(f"Prophet model.predict() failed: {e}", exc_info=True)
         return {"error": f"Prophet model prediction failed: {str(e)}"}
     print(f"validation_forecast head:\n{validation_forecast.head()}")
-    actual_values = validation_df["y"].values
-    forecasted_values = validation_forecast["yhat"].values
-    actual_values = actual_values[np.isfinite(forecasted_values)]
-    forecasted_values = forecasted_values[np.isfinite(forecasted_values)]
-    if not actual_values.size or not forecasted_values.size:
-        metrics = {"mae": "NaN", "rmse": "NaN"}
-    else:
-        mae = mean_absolute_error(actual_values, forecasted_values)
-        rmse = np.sqrt(mean_squared_error(actual_values, forecasted_values))
-        metrics = {"mae": mae, "rmse": rmse}
+    metrics, mae, rmse = _backtest_metrics(
+        validation_df["y"].values, validation_forecast["yhat"].values
+    )
     logger.info(
         f"Prophet backtesting completed... Metrics: MAE={mae:.2f}, RMSE={rmse:.2f}"
     )
     return {
         "metrics": metrics,
-        "forecast": validation_forecast[["ds", "yhat"]].to_dict("records"),
+        "forecast": forecast_records(validation_forecast),
     }
 
 
 def backtest_arima_forecast(
-    product_sku, historical_data, validation_horizon, arima_order=(0, 0, 0)
+    product_sku, ds, y, validation_horizon, arima_order=(0, 0, 0)
 ):
     """Backtests an ARIMA model for demand forecasting on historical product sales data and evaluates forecast accuracy.
 
     Args:
         product_sku (str): The SKU identifier of the product.
-        historical_data (pandas.DataFrame): Historical sales data containing at least 'transaction_date' and 'quantity' columns.
+        ds (numpy.ndarray): Observation dates, oldest first, as datetime64 values.
+        y (numpy.ndarray): Quantities aligned with `ds`.
         validation_horizon (int): Number of most recent days to reserve as the validation period.
         arima_order (tuple of int, optional): The (p, d, q) order parameters for the ARIMA model. Defaults to (0, 0, 0).
 
@@ -184,43 +336,33 @@ def backtest_arima_forecast(
     logger.info(
         f"Starting ARIMA backtesting for SKU: {product_sku}, validation_horizon: {validation_horizon}, ARIMA order: {arima_order}"
     )
-    df = historical_data[["transaction_date", "quantity"]].rename(
-        columns={"transaction_date": "ds", "quantity": "y"}
-    )
-    daily_df = df.groupby(pd.Grouper(key="ds", freq="D")).sum().reset_index()
-    daily_df["ds"] = pd.to_datetime(daily_df["ds"])
-    ts = daily_df.set_index("ds")["y"]
-    train_ts = ts[:-validation_horizon]
-    validation_ts = ts[-validation_horizon:]
-    if train_ts.empty or validation_ts.empty:
+    start, values = _daily_series(ds, y)
+    train_values = values[:-validation_horizon]
+    validation_values = values[-validation_horizon:]
+    if not len(train_values) or not len(validation_values):
         return {
             "error": "Insufficient data for backtesting. Need data for both training and validation periods."
         }
-    model = ARIMA(train_ts, order=arima_order)
     try:
-        model_fit = model.fit()
-        forecast_values = model_fit.predict(
-            start=validation_ts.index.min(), end=validation_ts.index.max()
-        )
+        model_fit = _fit_arima(product_sku, train_values, arima_order)
+        forecast_values = model_fit.forecast(steps=len(validation_values))
         validation_forecast_df = pd.DataFrame(
-            {"ds": validation_ts.index, "yhat": forecast_values}
+            {
+                "ds": pd.date_range(
+                    start=start + len(train_values),
+                    periods=len(validation_values),
+                    freq="D",
+                ),
+                "yhat": forecast_values,
+            }
         )
-        actual_values = validation_ts.values
-        forecasted_values = validation_forecast_df["yhat"].values
-        actual_values = actual_values[np.isfinite(forecasted_values)]
-        forecasted_values = forecasted_values[np.isfinite(forecasted_values)]
-        if not actual_values.size or not forecasted_values.size:
-            metrics = {"mae": "NaN", "rmse": "NaN"}
-        else:
-            mae = mean_absolute_error(actual_values, forecasted_values)
-            rmse = np.sqrt(mean_squared_error(actual_values, forecasted_values))
-            metrics = {"mae": mae, "rmse": rmse}
+        metrics, mae, rmse = _backtest_metrics(validation_values, forecast_values)
         logger.info(
             f"ARIMA backtesting completed... Metrics: MAE={mae:.2f}, RMSE={rmse:.2f}, ARIMA order: {arima_order}"
         )
         return {
             "metrics": metrics,
-            "forecast": validation_forecast_df[["ds", "yhat"]].to_dict("records"),
+            "forecast": forecast_records(validation_forecast_df),
             "arima_order_used": arima_order,
         }
     except Exception as e:
@@ -232,3 +374,31 @@ def backtest_arima_forecast(
             "metrics": {"mae": "NaN", "rmse": "NaN"},
             "forecast": [],
         }
+
+
+def warm_up():
+    """Runs each forecasting path once on a small synthetic series.
+
+    Called from gunicorn's post_worker_init hook and Celery's worker_process_init signal so the
+    first real request or task does not pay for loading Prophet's Stan model, statsmodels' first ARIMA fit or numba's compilation of
+    StatsForecast, holt_winters and _error_metrics. Failures are logged and otherwise ignored."""
+    history = pd.DataFrame(
+        {
+            "transaction_date": pd.date_range("2000-01-01", periods=30, freq="D"),
+            "quantity": np.arange(30) % 7 + 1,
+        }
+    )
+    try:
+        forecast_demand_statsforecast("warm-up", history, 1)
+        forecast_demand_prophet("warm-up", history, 1)
+        forecast_demand_arima(
+            "warm-up",
+            history["transaction_date"].to_numpy(),
+            history["quantity"].to_numpy(),
+            1,
+            arima_order=(1, 0, 0),
+        )
+        forecast_demand_holt_winters("warm-up", history, 1)
+        _error_metrics(np.zeros(1), np.zeros(1))
+    except Exception as e:
+        logger.warning(f"Forecast warm-up failed: {e}")
@@ -0,0 +1,129 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # numba only speeds up the numeric loops; fall back to plain Python
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+logger = logging.getLogger(__name__)
+HOLT_WINTERS_SEASON = 7
+HOLT_WINTERS_MAX_HORIZON = 30
+HOLT_WINTERS_MAX_HISTORY = 500
+
+
+@njit(cache=True, fastmath=True)
+def holt_winters(y, horizon, alpha, beta, gamma, season):
+    """Forecasts a series with additive Holt-Winters exponential smoothing.
+
+    The level and trend start from the first two seasons and the seasonal terms from the first
+    season's deviations around its mean. The smoothing weights are used as given, not fitted.
+
+    Args:
+        y (numpy.ndarray): The observed series, as float64, at least two seasons long.
+        horizon (int): The number of future periods to forecast.
+        alpha (float): Smoothing weight of the level, between 0 and 1.
+        beta (float): Smoothing weight of the trend, between 0 and 1.
+        gamma (float): Smoothing weight of the seasonal terms, between 0 and 1.
+        season (int): The season length in periods, e.g. 7 for weekly seasonality of daily data.
+
+    Returns:
+        tuple: (yhat, yhat_lower, yhat_upper) arrays of length `horizon`; the bounds are an
+            approximate 95% interval from the one-step-ahead residuals."""
+    n = y.shape[0]
+    level = y[:season].mean()
+    trend = (y[season : 2 * season].mean() - level) / season
+    seasonal = y[:season] - level
+    sq_err = 0.0
+    for t in range(season, n):
+        s = seasonal[t % season]
+        err = y[t] - (level + trend + s)
+        sq_err += err * err
+        previous_level = level
+        level = alpha * (y[t] - s) + (1.0 - alpha) * (level + trend)
+        trend = beta * (level - previous_level) + (1.0 - beta) * trend
+        seasonal[t % season] = gamma * (y[t] - level) + (1.0 - gamma) * s
+    sigma = np.sqrt(sq_err / max(n - season, 1))
+    yhat = np.empty(horizon)
+    yhat_lower = np.empty(horizon)
+    yhat_upper = np.empty(horizon)
+    for h in range(horizon):
+        yhat[h] = level + (h + 1) * trend + seasonal[(n + h) % season]
+        spread = 1.96 * sigma * np.sqrt(h + 1.0)
+        yhat_lower[h] = yhat[h] - spread
+        yhat_upper[h] = yhat[h] + spread
+    return yhat, yhat_lower, yhat_upper
+
+
+def use_holt_winters(horizon, history_days):
+    """Tells whether a demand forecast is small enough for the Holt-Winters fast path.
+
+    Args:
+        horizon (int): The number of future days requested.
+        history_days (int): The number of days in the product's demand history.
+
+    Returns:
+        bool: True for short horizons on short histories that still span two seasons."""
+    return (
+        horizon <= HOLT_WINTERS_MAX_HORIZON
+        and 2 * HOLT_WINTERS_SEASON <= history_days < HOLT_WINTERS_MAX_HISTORY
+    )
+
+
+def forecast_demand_holt_winters(
+    product_sku, historical_data, horizon, alpha=0.3, beta=0.05, gamma=0.1
+):
+    """Generates a daily demand forecast for a product with weekly Holt-Winters smoothing.
+
+    A cheap stand-in for Prophet on short horizons: there is no optimizer run, only one pass of
+    the compiled holt_winters loop over the daily series.
+
+    Args:
+        product_sku (str): The SKU identifier for the product being forecasted.
+        historical_data (pandas.DataFrame): DataFrame containing 'transaction_date' and 'quantity' columns.
+        horizon (int): Number of future days to forecast demand for.
+        alpha (float, optional): Smoothing weight of the level. Defaults to 0.3.
+        beta (float, optional): Smoothing weight of the trend. Defaults to 0.05.
+        gamma (float, optional): Smoothing weight of the weekly terms. Defaults to 0.1.
+
+    Returns:
+        list of dict: A list of dictionaries each containing 'ds' (forecast date as an ISO 8601 string)
+            and 'yhat' (predicted demand). Returns an empty list if forecasting fails."""
+    from .forecast import forecast_records
+
+    try:
+        daily = historical_data.groupby(pd.Grouper(key="transaction_date", freq="D"))[
+            "quantity"
+        ].sum()
+        yhat, _, _ = holt_winters(
+            np.ascontiguousarray(daily.to_numpy(), dtype=np.float64),
+            horizon,
+            alpha,
+            beta,
+            gamma,
+            HOLT_WINTERS_SEASON,
+        )
+        forecast = pd.DataFrame(
+            {
+                "ds": pd.date_range(
+                    daily.index[-1] + pd.Timedelta(days=1), periods=horizon, freq="D"
+                ),
+                "yhat": yhat,
+            }
+        )
+        return forecast_records(forecast)
+    except Exception as e:
+        logger.error(
+            "Holt-Winters forecasting failed for SKU: %s. Error: %s",
+            product_sku,
+            e,
+            exc_info=True,
+        )
+        return []
@@ -1,17 +1,38 @@
 from django.core.management.base import BaseCommand
 from faker import Faker
-from products.models import Product
+from products.models import (
+    Counters,
+    Product,
+    ProductDailyDemand,
+    ProductTransactionTotals,
+)
 from inventory_logs.models import InventoryLog
 from suppliers.models import Supplier
 from transactions.models import Transaction
 from django.contrib.auth import get_user_model
-from django.db import models, transaction as db_transaction
+from django.conf import settings
+from django.db import connection, transaction as db_transaction
+from datetime import timezone as dt_timezone
 from decimal import Decimal
 
 
 class Command(BaseCommand):
     help = "Seeds the database with initial data"
 
+    def add_arguments(self, parser):
+        """Adds the optional --reseed-full flag for large seed runs.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser instance to which the flag is added.
+
+        Returns:
+            None"""
+        parser.add_argument(
+            "--reseed-full",
+            action="store_true",
+            help="Drop secondary indexes on products and transactions while seeding and rebuild them afterwards. Only use against empty or staging databases.",
+        )
+
     def handle(self, *args, **options):
         """Seeds the database with initial data including users, suppliers, products, transactions, and inventory logs.
 
@@ -19,28 +40,49 @@ class Command(BaseCommand):
 
         Args:
             *args: Positional arguments passed to the command (unused).
-            **options: Keyword options passed to the command (unused).
+            **options: Keyword options passed to the command. When `reseed_full` is set, the
+                Meta indexes on products and transactions are dropped before the inserts and
+                rebuilt in one pass once seeding finishes.
 
         Returns:
             None. Outputs status messages to stdout indicating progress and success."""
         fake = Faker()
         User = get_user_model()
         self.stdout.write(self.style.SUCCESS("Seeding the database..."))
-        try:
-            admin_user = User.objects.get(username="admin")
-        except User.DoesNotExist:
+        existing_users = {
+            user.username: user
+            for user in User.objects.filter(username__in=["admin", "employee1"])
+        }
+        admin_user = existing_users.get("admin")
+        if admin_user is None:
             admin_user = User.objects.create_superuser(
                 username="admin", password="password", email="admin@example.com"
             )
-        try:
-            employee_user = User.objects.get(username="employee1")
-        except User.DoesNotExist:
+        employee_user = existing_users.get("employee1")
+        if employee_user is None:
             employee_user = User.objects.create_user(
                 username="employee1", password="password", email="employee1@example.com"
             )
-        suppliers = []
-        for _ in range(5):
-            supplier = Supplier.objects.create(
+        reindexed_models = (Product, Transaction) if options["reseed_full"] else ()
+        self.drop_secondary_indexes(reindexed_models)
+        try:
+            self.seed_inventory(fake, [admin_user, employee_user])
+        finally:
+            self.create_secondary_indexes(reindexed_models)
+        self.stdout.write(self.style.SUCCESS("Database seeded successfully!"))
+
+    def seed_inventory(self, fake, users):
+        """Bulk-creates suppliers, products, transactions and inventory logs.
+
+        Args:
+            fake (Faker): The Faker instance used to generate sample data.
+            users (list): Users randomly attributed to the generated inventory log entries.
+
+        Returns:
+            None"""
+        batch_size = settings.STORER_BULK_BATCH_SIZE
+        suppliers = [
+            Supplier(
                 name=fake.company(),
                 contact_name=fake.name(),
                 contact_email=fake.email(),
@@ -52,7 +94,14 @@ class Command(BaseCommand):
                 ),
                 notes=fake.sentence(),
             )
-            suppliers.append(supplier)
+            for _ in range(5)
+        ]
+        Supplier.objects.bulk_create(suppliers, batch_size=batch_size)
+        suppliers = list(
+            Supplier.objects.filter(
+                supplier_code__in=[supplier.supplier_code for supplier in suppliers]
+            )
+        )
 
         def generate_decimal():
             return Decimal(
@@ -61,9 +110,8 @@ class Command(BaseCommand):
                 + str(fake.random_number(digits=2))
             )
 
-        products = []
-        for _ in range(20):
-            product = Product.objects.create(
+        products = [
+            Product(
                 name=fake.word().capitalize() + " " + fake.word().capitalize(),
                 description=fake.sentence(),
                 price=generate_decimal(),
@@ -71,15 +119,25 @@ class Command(BaseCommand):
                 category=fake.random_element(
                     elements=("Electronics", "Clothing", "Food", "Home Goods")
                 ),
-                sku=Product.generate_sku(Product),
                 cost_price=generate_decimal(),
                 unit=fake.random_element(elements=("piece", "kg", "liter", "box")),
                 reorder_point=fake.random_int(min=5, max=20),
                 lead_time_days=fake.random_int(min=1, max=14),
                 discontinued=fake.boolean(),
             )
-            products.append(product)
+            for _ in range(20)
+        ]
+        Product.objects.bulk_create(
+            products, batch_size=batch_size, ignore_conflicts=True
+        )
+        # MySQL does not return primary keys from bulk_create, so reload the
+        # rows by their unique SKU before using them as foreign keys.
+        products = list(
+            Product.objects.filter(sku__in=[product.sku for product in products])
+        )
         with db_transaction.atomic():
+            transactions = []
+            inventory_logs = []
             for _ in range(50):
                 product = fake.random_element(elements=products)
                 transaction_type = fake.random_element(elements=("sale", "purchase"))
@@ -90,30 +148,67 @@ class Command(BaseCommand):
                     supplier = None
                     stock_change = -quantity
                 else:
-                    customer_name = None
+                    customer_name = ""
                     supplier = fake.random_element(elements=suppliers)
                     stock_change = quantity
-                transaction_id = fake.unique.lexify(text="TXN-????")
-                transaction = Transaction.objects.create(
+                # transaction_id is left to its uuid default, so ids never collide
+                # with an earlier seed run's rows.
+                transaction = Transaction(
                     product=product,
                     transaction_type=transaction_type,
+                    transaction_date=fake.date_time_between(
+                        start_date="-1y", tzinfo=dt_timezone.utc
+                    ),
                     quantity=quantity,
                     unit_price=unit_price,
                     customer_name=customer_name,
                     supplier=supplier,
-                    total_amount=unit_price * quantity,
-                    transaction_id=transaction_id,
                 )
-                InventoryLog.objects.create(
-                    product=product,
-                    stock_change=stock_change,
-                    reason=f"{transaction_type.capitalize()} Transaction",
-                    source=transaction.transaction_id,
-                    user=fake.random_element(elements=[admin_user, employee_user])
-                    if User.objects.count() > 0
-                    else None,
-                )
-                Product.objects.filter(pk=product.pk).update(
-                    stock_level=models.F("stock_level") + stock_change
+                transactions.append(transaction)
+                inventory_logs.append(
+                    InventoryLog(
+                        product=product,
+                        stock_change=stock_change,
+                        reason_code=transaction_type,
+                        source=transaction.transaction_id,
+                        user=fake.random_element(elements=users),
+                    )
                 )
-        self.stdout.write(self.style.SUCCESS("Database seeded successfully!"))
+                product.stock_level += stock_change
+            Transaction.objects.bulk_create(transactions, batch_size=batch_size)
+            InventoryLog.objects.bulk_create(inventory_logs, batch_size=batch_size)
+            Product.objects.bulk_update(
+                products, ["stock_level"], batch_size=batch_size
+            )
+            # bulk_create skips the save signals that maintain these tables.
+            ProductDailyDemand.objects.rebuild()
+            ProductTransactionTotals.objects.rebuild()
+            Counters.objects.rebuild()
+
+    def drop_secondary_indexes(self, models):
+        """Drops the Meta indexes of the given models so bulk inserts skip incremental index maintenance.
+
+        Args:
+            models (Iterable[type[Model]]): Models whose Meta indexes should be dropped.
+
+        Returns:
+            None"""
+        with connection.schema_editor() as schema_editor:
+            for model in models:
+                for index in model._meta.indexes:
+                    schema_editor.remove_index(model, index)
+
+    def create_secondary_indexes(self, models):
+        """Rebuilds the Meta indexes of the given models after a bulk seed.
+
+        Args:
+            models (Iterable[type[Model]]): Models whose Meta indexes should be recreated.
+
+        Returns:
+            None"""
+        if models:
+            self.stdout.write(self.style.SUCCESS("Rebuilding secondary indexes..."))
+        with connection.schema_editor() as schema_editor:
+            for model in models:
+                for index in model._meta.indexes:
+                    schema_editor.add_index(model, index)
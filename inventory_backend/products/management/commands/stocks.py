@@ -1,7 +1,9 @@
 from django.core.management.base import BaseCommand
 from products.models import Product
+from products.signals import invalidate_product_list
 from transactions.models import Transaction
-from django.db.models import Sum
+from django.conf import settings
+from django.db.models import Q, Sum
 from django.utils import timezone
 import datetime
 
@@ -12,8 +14,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         """Calculates and updates the stock levels for all products based on purchase and sale transactions.
 
-        Iterates over all Product instances, computes the total purchased and sold quantities from related Transaction records,
-        and updates each product's stock_level accordingly.
+        Computes the total purchased and sold quantities per product from Transaction records in a single grouped query,
+        then writes every product's stock_level back with one batched bulk update.
 
         Args:
             *args: Variable length argument list (not used).
@@ -26,30 +28,30 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS("Calculating and updating stock levels...")
         )
-        for product in Product.objects.all():
-            stock_level = 0
-            total_purchased = (
-                Transaction.objects.filter(
-                    product=product, transaction_type="purchase"
-                ).aggregate(total=Sum("quantity"))["total"]
-                or 0
+        totals = (
+            Transaction.objects.values("product_id")
+            .annotate(
+                total_purchased=Sum("quantity", filter=Q(transaction_type="purchase")),
+                total_sold=Sum("quantity", filter=Q(transaction_type="sale")),
             )
-            total_purchased = total_purchased if total_purchased is not None else 0
-            total_sold = (
-                Transaction.objects.filter(
-                    product=product, transaction_type="sale"
-                ).aggregate(total=Sum("quantity"))["total"]
-                or 0
-            )
-            total_sold = total_sold if total_sold is not None else 0
-            stock_level = total_purchased - total_sold
-            product.stock_level = stock_level
-            product.save()
+            .order_by()
+        )
+        totals_by_product = {row["product_id"]: row for row in totals}
+        products = list(Product.objects.only("id", "sku", "stock_level"))
+        for product in products:
+            row = totals_by_product.get(product.id, {})
+            total_purchased = row.get("total_purchased") or 0
+            total_sold = row.get("total_sold") or 0
+            product.stock_level = total_purchased - total_sold
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Updated stock level for product {product.sku} to {product.stock_level}"
                 )
             )
+        Product.objects.bulk_update(
+            products, ["stock_level"], batch_size=settings.STORER_BULK_BATCH_SIZE
+        )
+        invalidate_product_list()
         self.stdout.write(
             self.style.SUCCESS(
                 "Stock level calculation and update completed successfully!"
@@ -1,5 +1,8 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from products.models import Product
+from products.utils import calculate_reorder_points_bulk
+from products.signals import invalidate_product_list
 
 
 class Command(BaseCommand):
@@ -8,7 +11,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         """Handles the update of reorder points for all products in the inventory.
 
-        Retrieves all Product instances and calls their `update_reorder_point` method to refresh reorder levels.
+        Retrieves all Product instances, loading only the columns the calculation and output need, recalculates their reorder points in memory and writes them back
+        with one batched bulk update instead of one save per product.
         For each product, a success message is output to the console indicating the updated reorder point.
         Finally, a summary success message is printed after all products have been processed.
 
@@ -18,14 +22,23 @@ class Command(BaseCommand):
 
         Returns:
             None"""
-        products = Product.objects.all()
+        products = list(
+            Product.objects.select_related("supplier").only(
+                "id", "sku", "name", "reorder_point", "supplier"
+            )
+        )
+        reorder_points = calculate_reorder_points_bulk(products)
         for product in products:
-            product.update_reorder_point()
+            product.reorder_point = reorder_points[product.sku]
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully updated reorder point for {product.name} to {product.reorder_point}"
                 )
             )
+        Product.objects.bulk_update(
+            products, ["reorder_point"], batch_size=settings.STORER_BULK_BATCH_SIZE
+        )
+        invalidate_product_list()
         self.stdout.write(
             self.style.SUCCESS("Successfully updated reorder points for all products.")
         )
@@ -0,0 +1,34 @@
+# Generated by Django 5.1 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0003_product_supplier"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="product",
+            name="category",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=50, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["discontinued"], name="product_discontinued_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("discontinued", False)),
+                fields=["category"],
+                name="active_by_cat_idx",
+            ),
+        ),
+    ]
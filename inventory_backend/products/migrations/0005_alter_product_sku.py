@@ -0,0 +1,21 @@
+# Generated by Django 5.1 on 2026-10-15 09:40
+
+import products.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0004_alter_product_category_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="product",
+            name="sku",
+            field=models.CharField(
+                default=products.models.generate_sku, max_length=50, unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1 on 2026-10-15 13:20
+
+from datetime import timezone as dt_timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_demand(apps, schema_editor):
+    Transaction = apps.get_model("transactions", "Transaction")
+    ProductDailyDemand = apps.get_model("products", "ProductDailyDemand")
+    daily_totals = (
+        Transaction.objects.annotate(
+            day=TruncDate("transaction_date", tzinfo=dt_timezone.utc)
+        )
+        .values("product_id", "day")
+        .annotate(quantity=Sum("quantity"))
+        .order_by()
+    )
+    ProductDailyDemand.objects.bulk_create(
+        (ProductDailyDemand(**row) for row in daily_totals), batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0005_alter_product_sku"),
+        ("transactions", "0003_transaction_tx_product_date_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductDailyDemand",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("quantity", models.IntegerField(default=0)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_demand",
+                        to="products.product",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "product_daily_demand",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "day"), name="product_daily_demand_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_daily_demand, migrations.RunPython.noop),
+    ]
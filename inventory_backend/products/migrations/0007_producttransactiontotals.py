@@ -0,0 +1,64 @@
+# Generated by Django 5.1 on 2026-10-15 15:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_transaction_totals(apps, schema_editor):
+    Transaction = apps.get_model("transactions", "Transaction")
+    ProductTransactionTotals = apps.get_model("products", "ProductTransactionTotals")
+    is_sale = Q(transaction_type="sale")
+    totals = (
+        Transaction.objects.values("product_id")
+        .annotate(
+            total_sales=Sum("total_amount", filter=is_sale, default=0),
+            total_cost=Sum(
+                "total_amount", filter=Q(transaction_type="purchase"), default=0
+            ),
+            sales_count=Count("id", filter=is_sale),
+        )
+        .order_by()
+    )
+    ProductTransactionTotals.objects.bulk_create(
+        (ProductTransactionTotals(**row) for row in totals), batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0006_productdailydemand"),
+        ("transactions", "0006_transaction_tx_type_date_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductTransactionTotals",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="transaction_totals",
+                        serialize=False,
+                        to="products.product",
+                    ),
+                ),
+                (
+                    "total_sales",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "total_cost",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("sales_count", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "dashboard_totals",
+            },
+        ),
+        migrations.RunPython(backfill_transaction_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1 on 2026-10-15 16:40
+
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+    Counters = apps.get_model("products", "Counters")
+    Counters.objects.create(pk=1, products_total=Product.objects.count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0007_producttransactiontotals"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Counters",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("products_total", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "counters",
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
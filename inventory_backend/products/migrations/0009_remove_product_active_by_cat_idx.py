@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 18:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_counters"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="product",
+            name="active_by_cat_idx",
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1 on 2026-10-15 18:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0009_remove_product_active_by_cat_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DemandHistoryVersion",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="products.product",
+                    ),
+                ),
+                ("version", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "demand_history_versions",
+            },
+        ),
+    ]
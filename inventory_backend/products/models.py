@@ -1,16 +1,36 @@
-from django.db import models
+import uuid
+from time import time_ns
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db import connection, models, transaction as db_transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
 from suppliers.models import Supplier
+from transactions.models import Transaction
 from .utils import calculate_reorder_point
 
 
+def generate_sku():
+    """Generates a unique SKU string for a product using a UUID.
+
+    Used as the default for `Product.sku`, so Django assigns it on instantiation and
+    `bulk_create` gets SKUs without a per-row `save()` call.
+
+    Returns:
+        str: A 12-character uppercase string serving as a unique SKU."""
+    return str(uuid.uuid4())[:12].upper()
+
+
 class Product(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True, default="")
     price = models.DecimalField(max_digits=10, decimal_places=2)
     stock_level = models.IntegerField(default=0)
-    category = models.CharField(max_length=50, blank=True, null=True, default="")
+    category = models.CharField(
+        max_length=50, blank=True, null=True, default="", db_index=True
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    sku = models.CharField(max_length=50, unique=True)
+    sku = models.CharField(max_length=50, unique=True, default=generate_sku)
     supplier = models.ForeignKey(
         Supplier,
         on_delete=models.SET_NULL,
@@ -36,21 +56,6 @@ class Product(models.Model):
             str: The name of the product."""
         return self.name
 
-    def save(self, *args, **kwargs):
-        """Saves the product instance, generating and assigning a SKU if it is not already set.
-
-        Args:
-            *args: Variable length argument list passed to the parent save method.
-            **kwargs: Arbitrary keyword arguments passed to the parent save method.
-
-        Returns:
-            None
-
-        This method overrides the default save behavior to ensure that each product has a SKU before saving to the database."""
-        if not self.sku:
-            self.sku = self.generate_sku()
-        super().save(*args, **kwargs)
-
     def update_reorder_point(self):
         """Updates the product's reorder point by recalculating it and saving the updated value.
 
@@ -65,17 +70,379 @@ class Product(models.Model):
         self.reorder_point = calculate_reorder_point(self)
         self.save()
 
-    def generate_sku(self):
-        """Generates a unique SKU string for the product using a UUID.
+    class Meta:
+        db_table = "products"
+        indexes = [
+            models.Index(fields=["discontinued"], name="product_discontinued_idx"),
+        ]
 
-        The SKU is created by generating a UUID4, converting it to a string,
-        taking the first 12 characters, and converting them to uppercase.
+
+def _lock_products(product_ids):
+    """Row-locks the given products, in primary key order, until the database transaction ends.
+
+    The derived-table refreshes take it before aggregating, so concurrent writes for one product
+    recompute one after the other and the later one sees the earlier one's committed rows."""
+    list(
+        Product.objects.select_for_update()
+        .filter(pk__in=product_ids)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def _upsert_target(*fields):
+    """Returns the bulk_create upsert target, which MySQL rejects since it upserts on any unique key."""
+    if connection.features.supports_update_conflicts_with_target:
+        return {"unique_fields": list(fields)}
+    return {}
+
+
+class ProductDailyDemandManager(models.Manager):
+    def version(self, product_id):
+        """Returns the version of a product's demand history, for use in cache keys.
+
+        Stored in the database and moved on by every refresh(), refresh_many() or rebuild() that
+        rewrites the product's rows, so every process sees the new version as soon as the write
+        commits and any edit of a transaction changes it.
+
+        Args:
+            product_id (int): The primary key of the product.
 
         Returns:
-            str: A 12-character uppercase string serving as a unique SKU."""
-        import uuid
+            int: The version; 0 if the product's history was never written."""
+        version = (
+            DemandHistoryVersion.objects.filter(product_id=product_id)
+            .values_list("version", flat=True)
+            .first()
+        )
+        return version or 0
+
+    def refresh(self, product_id, day):
+        """Recomputes one product's demand row for a single UTC day from its transactions.
+
+        The product row is locked first, so concurrent refreshes of it cannot store a total that
+        misses the other's transaction.
+
+        Args:
+            product_id (int): The primary key of the product.
+            day (datetime.date): The UTC calendar day to recompute.
+
+        Returns:
+            None"""
+        start = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+        with db_transaction.atomic(savepoint=False):
+            _lock_products([product_id])
+            total = Transaction.objects.filter(
+                product_id=product_id,
+                transaction_date__gte=start,
+                transaction_date__lt=start + timedelta(days=1),
+            ).aggregate(total=Sum("quantity"))["total"]
+            if total is None:
+                self.filter(product_id=product_id, day=day).delete()
+            else:
+                self.update_or_create(
+                    product_id=product_id, day=day, defaults={"quantity": total}
+                )
+            DemandHistoryVersion.objects.bump([product_id])
 
-        return str(uuid.uuid4())[:12].upper()
+    def refresh_many(self, product_days):
+        """Recomputes the demand rows of several (product, UTC day) pairs after transactions were added.
+
+        Uses one grouped aggregate and one upsert instead of a refresh() per pair. Rows are only
+        written, never deleted, so it suits inserts, not deletes.
+
+        Args:
+            product_days (Iterable[tuple]): (product_id, datetime.date) pairs to recompute.
+
+        Returns:
+            None"""
+        product_days = set(product_days)
+        if not product_days:
+            return
+        product_ids = {product_id for product_id, _ in product_days}
+        days = [day for _, day in product_days]
+        start = datetime.combine(min(days), time.min, tzinfo=dt_timezone.utc)
+        end = datetime.combine(max(days), time.min, tzinfo=dt_timezone.utc)
+        with db_transaction.atomic(savepoint=False):
+            _lock_products(product_ids)
+            daily_totals = (
+                Transaction.objects.filter(
+                    product_id__in=product_ids,
+                    transaction_date__gte=start,
+                    transaction_date__lt=end + timedelta(days=1),
+                )
+                .annotate(
+                    day=TruncDate("transaction_date", tzinfo=dt_timezone.utc)
+                )
+                .values("product_id", "day")
+                .annotate(quantity=Sum("quantity"))
+                .order_by()
+            )
+            self.bulk_create(
+                [
+                    self.model(**row)
+                    for row in daily_totals
+                    if (row["product_id"], row["day"]) in product_days
+                ],
+                batch_size=settings.STORER_BULK_BATCH_SIZE,
+                update_conflicts=True,
+                update_fields=["quantity"],
+                **_upsert_target("product", "day"),
+            )
+            DemandHistoryVersion.objects.bump(product_ids)
+
+    def rebuild(self):
+        """Replaces every row with daily totals aggregated from the transactions table.
+
+        Used after bulk inserts, which bypass the Transaction save signals.
+
+        Returns:
+            None"""
+        daily_totals = (
+            Transaction.objects.annotate(
+                day=TruncDate("transaction_date", tzinfo=dt_timezone.utc)
+            )
+            .values("product_id", "day")
+            .annotate(quantity=Sum("quantity"))
+            .order_by()
+        )
+        with db_transaction.atomic():
+            self.all().delete()
+            self.bulk_create(
+                (self.model(**row) for row in daily_totals),
+                batch_size=settings.STORER_BULK_BATCH_SIZE,
+            )
+            DemandHistoryVersion.objects.bump(
+                Product.objects.values_list("pk", flat=True)
+            )
+
+
+class ProductDailyDemand(models.Model):
+    """Total transaction quantity per product and UTC day, the series the forecasting models fit on.
+
+    Kept in sync with Transaction by the signal handlers in products.signals."""
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="daily_demand"
+    )
+    day = models.DateField()
+    quantity = models.IntegerField(default=0)
+
+    objects = ProductDailyDemandManager()
+
+    def __str__(self):
+        """Returns the product, day and quantity, e.g. "3 @ 2026-01-31: 12"."""
+        return f"{self.product_id} @ {self.day}: {self.quantity}"
 
     class Meta:
-        db_table = "products"
+        db_table = "product_daily_demand"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "day"], name="product_daily_demand_uniq"
+            ),
+        ]
+
+
+class DemandHistoryVersionManager(models.Manager):
+    def bump(self, product_ids):
+        """Moves the demand history version of the given products on, in one upsert.
+
+        Versions are nanosecond timestamps rather than counters, so a row that is deleted with its
+        product and created again never brings back a version that is already in some cache.
+
+        Args:
+            product_ids (Iterable[int]): The primary keys of the products.
+
+        Returns:
+            None"""
+        version = time_ns()
+        self.bulk_create(
+            [
+                self.model(product_id=product_id, version=version)
+                for product_id in product_ids
+            ],
+            batch_size=settings.STORER_BULK_BATCH_SIZE,
+            update_conflicts=True,
+            update_fields=["version"],
+            **_upsert_target("product"),
+        )
+
+
+class DemandHistoryVersion(models.Model):
+    """The version of each product's daily demand history, the key of the caches built on it.
+
+    Lives in the database rather than the Django cache, whose default backend is per process,
+    so gunicorn and Celery workers all agree on when a product's history changed. A separate
+    table keeps it out of Product.save(), which writes back every column it loaded."""
+
+    product = models.OneToOneField(
+        Product, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
+    version = models.BigIntegerField(default=0)
+
+    objects = DemandHistoryVersionManager()
+
+    class Meta:
+        db_table = "demand_history_versions"
+
+
+def _transaction_totals():
+    """Annotations summing a transaction queryset into the ProductTransactionTotals columns."""
+    is_sale = Q(transaction_type="sale")
+    return {
+        "total_sales": Sum("total_amount", filter=is_sale, default=0),
+        "total_cost": Sum(
+            "total_amount", filter=Q(transaction_type="purchase"), default=0
+        ),
+        "sales_count": Count("id", filter=is_sale),
+    }
+
+
+class ProductTransactionTotalsManager(models.Manager):
+    def refresh(self, product_id):
+        """Recomputes one product's totals row from its transactions, with the product row locked.
+
+        Args:
+            product_id (int): The primary key of the product.
+
+        Returns:
+            None"""
+        transactions = Transaction.objects.filter(product_id=product_id)
+        with db_transaction.atomic(savepoint=False):
+            _lock_products([product_id])
+            if not transactions.exists():
+                self.filter(product_id=product_id).delete()
+                return
+            self.update_or_create(
+                product_id=product_id,
+                defaults=transactions.aggregate(**_transaction_totals()),
+            )
+
+    def refresh_many(self, product_ids):
+        """Recomputes the totals rows of several products with one grouped aggregate and one upsert.
+
+        Rows are only written, never deleted, so it suits inserts, not deletes.
+
+        Args:
+            product_ids (Iterable[int]): The primary keys of the products.
+
+        Returns:
+            None"""
+        product_ids = list(product_ids)
+        totals = (
+            Transaction.objects.filter(product_id__in=product_ids)
+            .values("product_id")
+            .annotate(**_transaction_totals())
+            .order_by()
+        )
+        with db_transaction.atomic(savepoint=False):
+            _lock_products(product_ids)
+            self.bulk_create(
+                [self.model(**row) for row in totals],
+                batch_size=settings.STORER_BULK_BATCH_SIZE,
+                update_conflicts=True,
+                update_fields=["total_sales", "total_cost", "sales_count"],
+                **_upsert_target("product"),
+            )
+
+    def rebuild(self):
+        """Replaces every row with per-product totals aggregated from the transactions table.
+
+        Used after bulk inserts, which bypass the Transaction save signals.
+
+        Returns:
+            None"""
+        totals = (
+            Transaction.objects.values("product_id")
+            .annotate(**_transaction_totals())
+            .order_by()
+        )
+        with db_transaction.atomic():
+            self.all().delete()
+            self.bulk_create(
+                (self.model(**row) for row in totals),
+                batch_size=settings.STORER_BULK_BATCH_SIZE,
+            )
+
+
+class ProductTransactionTotals(models.Model):
+    """Per-product sales and purchase totals, the pre-aggregated source of the dashboard metrics.
+
+    Plays the role of a materialized view, which MySQL lacks: the signal handlers in
+    products.signals recompute a product's row whenever one of its transactions changes, so the
+    dashboard sums one row per product instead of scanning every transaction."""
+
+    product = models.OneToOneField(
+        Product,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="transaction_totals",
+    )
+    total_sales = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_cost = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    sales_count = models.IntegerField(default=0)
+
+    objects = ProductTransactionTotalsManager()
+
+    def __str__(self):
+        """Returns the product id with its sales total, e.g. "3: sales 120.50"."""
+        return f"{self.product_id}: sales {self.total_sales}"
+
+    class Meta:
+        db_table = "dashboard_totals"
+
+
+class CountersManager(models.Manager):
+    def current(self):
+        """Returns the counters row, creating it from live counts if it does not exist yet.
+
+        Returns:
+            Counters: The singleton row."""
+        counters = self.filter(pk=Counters.SINGLETON_ID).first()
+        return counters if counters is not None else self.rebuild()
+
+    def adjust(self, **deltas):
+        """Atomically adds the given amounts to the counter columns, e.g. adjust(products_total=1).
+
+        Args:
+            **deltas: Amounts keyed by counter field name; negative amounts decrement.
+
+        Returns:
+            None"""
+        updated = self.filter(pk=Counters.SINGLETON_ID).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+        if not updated:
+            self.rebuild()
+
+    def rebuild(self):
+        """Recounts every counter from its table, correcting any drift.
+
+        Used after bulk inserts, which bypass the save signals.
+
+        Returns:
+            Counters: The refreshed singleton row."""
+        counters, _ = self.update_or_create(
+            pk=Counters.SINGLETON_ID,
+            defaults={"products_total": Product.objects.count()},
+        )
+        return counters
+
+
+class Counters(models.Model):
+    """Single-row table of denormalized row counts read by the dashboard instead of COUNT(*).
+
+    Kept current by the signal handlers in products.signals."""
+
+    SINGLETON_ID = 1
+
+    products_total = models.IntegerField(default=0)
+
+    objects = CountersManager()
+
+    def __str__(self):
+        """Returns the counters as a short summary, e.g. "products: 58"."""
+        return f"products: {self.products_total}"
+
+    class Meta:
+        db_table = "counters"
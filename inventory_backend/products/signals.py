@@ -0,0 +1,152 @@
+import time
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from datetime import timezone as dt_timezone
+from transactions.models import Transaction
+from .models import Counters, Product, ProductDailyDemand, ProductTransactionTotals
+
+
+PRODUCT_LIST_VERSION_KEY = "product:list:version"
+
+
+def product_cache_key(product_sku):
+    """Returns the cache key under which the forecast views store a product looked up by SKU."""
+    return f"product:{product_sku}"
+
+
+def product_list_cache_key(full_path):
+    """Returns the cache key of a product list response, scoped to the current list version.
+
+    Args:
+        full_path (str): The request path with its query string, so each page and filter is
+            cached separately.
+
+    Returns:
+        str: The cache key."""
+    version = cache.get_or_set(PRODUCT_LIST_VERSION_KEY, time.time_ns, None)
+    return f"product:list:{version}:{full_path}"
+
+
+def invalidate_product_list():
+    """Makes every cached product list unreachable by moving to a new list version.
+
+    Call after writes that change product rows without Product signals, such as the F()
+    stock updates and bulk updates. A timestamp is used rather than a counter so an evicted
+    version key can never bring back older entries."""
+    cache.set(PRODUCT_LIST_VERSION_KEY, time.time_ns(), None)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product_cache(sender, instance, **kwargs):
+    """Drops the cached copy of a product and the cached product lists whenever it is saved or deleted.
+
+    Args:
+        sender (type): The Product model class.
+        instance (Product): The product that was saved or deleted.
+        **kwargs: Additional signal arguments (unused).
+
+    Returns:
+        None"""
+    cache.delete(product_cache_key(instance.sku))
+    invalidate_product_list()
+
+
+@receiver(post_save, sender=Product)
+def count_created_product(sender, instance, created, **kwargs):
+    """Increments the product counter when a product is created.
+
+    Args:
+        sender (type): The Product model class.
+        instance (Product): The product that was saved.
+        created (bool): Whether the save inserted a new row.
+        **kwargs: Additional signal arguments (unused).
+
+    Returns:
+        None"""
+    if created:
+        Counters.objects.adjust(products_total=1)
+
+
+@receiver(post_delete, sender=Product)
+def count_deleted_product(sender, instance, **kwargs):
+    """Decrements the product counter when a product is deleted.
+
+    Args:
+        sender (type): The Product model class.
+        instance (Product): The product that was deleted.
+        **kwargs: Additional signal arguments (unused).
+
+    Returns:
+        None"""
+    Counters.objects.adjust(products_total=-1)
+
+
+def _utc_day(transaction_date):
+    """Returns the UTC calendar day a transaction's demand is counted on."""
+    return transaction_date.astimezone(dt_timezone.utc).date()
+
+
+@receiver(pre_save, sender=Transaction)
+def remember_previous_demand(sender, instance, **kwargs):
+    """Records the product and date a transaction had before an update, on `_previous_demand`.
+
+    The post_save handlers use it to recompute the rows the transaction no longer counts
+    towards when an edit moves it to another day or product.
+
+    Args:
+        sender (type): The Transaction model class.
+        instance (Transaction): The transaction about to be saved.
+        **kwargs: Additional signal arguments (unused).
+
+    Returns:
+        None"""
+    instance._previous_demand = (
+        Transaction.objects.filter(pk=instance.pk)
+        .values_list("product_id", "transaction_date")
+        .first()
+        if instance.pk is not None
+        else None
+    )
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+def refresh_daily_demand(sender, instance, **kwargs):
+    """Recomputes the daily demand rows a transaction counts, or counted, towards after it is saved or deleted.
+
+    Args:
+        sender (type): The Transaction model class.
+        instance (Transaction): The transaction that was saved or deleted.
+        **kwargs: Additional signal arguments (unused).
+
+    Returns:
+        None"""
+    rows = {(instance.product_id, _utc_day(instance.transaction_date))}
+    previous = getattr(instance, "_previous_demand", None)
+    if previous is not None:
+        rows.add((previous[0], _utc_day(previous[1])))
+    # Sorted so edits that touch two products lock them in the same order.
+    for product_id, day in sorted(rows):
+        ProductDailyDemand.objects.refresh(product_id, day)
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+def refresh_transaction_totals(sender, instance, **kwargs):
+    """Recomputes the dashboard totals of a transaction's product, and of its previous product, after it is saved or deleted.
+
+    Args:
+        sender (type): The Transaction model class.
+        instance (Transaction): The transaction that was saved or deleted.
+        **kwargs: Additional signal arguments (unused).
+
+    Returns:
+        None"""
+    product_ids = {instance.product_id}
+    previous = getattr(instance, "_previous_demand", None)
+    if previous is not None:
+        product_ids.add(previous[0])
+    for product_id in sorted(product_ids):
+        ProductTransactionTotals.objects.refresh(product_id)
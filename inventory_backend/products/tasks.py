@@ -0,0 +1,290 @@
+import logging
+
+import numpy as np
+import orjson
+import pandas as pd
+from celery import shared_task
+from django.core.cache import cache
+from django.db import connection
+from rest_framework import status
+
+from .utils import load_daily_demand_arrays, load_daily_demand_df
+from .forecast_fast import forecast_demand_holt_winters, use_holt_winters
+from .forecast import (
+    forecast_demand_statsforecast,
+    forecast_demand_prophet,
+    forecast_demand_arima,
+    backtest_prophet_forecast,
+    backtest_arima_forecast,
+    forecast_records,
+)
+
+logger = logging.getLogger(__name__)
+FORECAST_CACHE_TIMEOUT = 3600
+DEMAND_FORECASTERS = {
+    "statsforecast": forecast_demand_statsforecast,
+    "prophet": forecast_demand_prophet,
+}
+
+
+def read_queryset_df(queryset, columns):
+    """Runs a values_list() queryset through pandas.read_sql and names the resulting columns.
+
+    Each column is copied into its own contiguous 1-D array, so the column-wise resampling and
+    model fits downstream read stride-1 memory instead of a row-interleaved block.
+
+    Args:
+        queryset (QuerySet): A values_list() queryset.
+        columns (list): Names for the selected columns, in order.
+
+    Returns:
+        pandas.DataFrame: The query result."""
+    sql, params = queryset.query.sql_with_params()
+    df = pd.read_sql(sql, connection, params=params)
+    return pd.DataFrame(
+        {
+            column: np.ascontiguousarray(df.iloc[:, position].to_numpy())
+            for position, column in enumerate(columns)
+        }
+    )
+
+
+def cache_response(cache_key, response_data):
+    """Stores a successful forecast response in the cache as orjson-encoded bytes.
+
+    A single bytes value is much cheaper for the cache backend to pickle and move than the nested
+    list of forecast dicts.
+
+    Args:
+        cache_key (str): The key built by the view for this request.
+        response_data (dict): The response body.
+
+    Returns:
+        None"""
+    cache.set(cache_key, orjson.dumps(response_data), FORECAST_CACHE_TIMEOUT)
+
+
+def get_cached_response(cache_key):
+    """Returns the forecast response cached under a key, decoded, or None if there is none.
+
+    Args:
+        cache_key (str): The key built by the view for this request.
+
+    Returns:
+        dict|None: The cached response body."""
+    cached = cache.get(cache_key)
+    return None if cached is None else orjson.loads(cached)
+
+
+def _result(data, status_code=status.HTTP_200_OK):
+    """Packs a task's response body and HTTP status into a JSON-serializable result."""
+    return {"status": status_code, "data": data}
+
+
+def _no_history_result():
+    return _result(
+        {"error": "No historical transaction data found for this product."},
+        status.HTTP_404_NOT_FOUND,
+    )
+
+
+@shared_task
+def run_demand_forecast(
+    product_id, product_sku, product_details, horizon, model, cache_key
+):
+    """Fits a demand model to a product's daily demand history and forecasts its demand.
+
+    Args:
+        product_id (int): The primary key of the product.
+        product_sku (str): The SKU identifier of the product.
+        product_details (dict): The product's 'name' and 'description', echoed in the response.
+        horizon (int): The number of future periods to forecast.
+        model (str): A key of DEMAND_FORECASTERS, 'statsforecast' or 'prophet'. Short Prophet
+            forecasts are served by the Holt-Winters fast path instead.
+        cache_key (str): The key the successful response is cached under.
+
+    Returns:
+        dict: The response body under 'data' and its HTTP status code under 'status'."""
+    try:
+        df = load_daily_demand_df(product_id)
+        if df.empty:
+            return _no_history_result()
+        forecaster = DEMAND_FORECASTERS[model]
+        if model == "prophet" and use_holt_winters(horizon, len(df)):
+            forecaster = forecast_demand_holt_winters
+        forecast = forecaster(product_sku, df, horizon)
+        if not forecast:
+            return _result(
+                {"error": "Forecast is empty due to an error during prediction."},
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        response_data = {"product_details": product_details, "forecast": forecast}
+        cache_response(cache_key, response_data)
+        return _result(response_data)
+    except Exception as e:
+        logger.exception(
+            "An unexpected error occurred during the forecasting process.",
+            exc_info=True,
+        )
+        return _result(
+            {"error": f"An unexpected error occurred: {str(e)}"},
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@shared_task
+def run_arima_forecast(
+    product_id, product_sku, product_details, horizon, arima_order, cache_key
+):
+    """Fits ARIMA to a product's transaction history and forecasts its demand.
+
+    Args:
+        product_id (int): The primary key of the product.
+        product_sku (str): The SKU identifier of the product.
+        product_details (dict): The product's 'name' and 'description', echoed in the response.
+        horizon (int): The number of future periods to forecast.
+        arima_order (tuple): The ARIMA (p, d, q) order.
+        cache_key (str): The key the successful response is cached under.
+
+    Returns:
+        dict: The response body under 'data' and its HTTP status code under 'status'."""
+    arima_order = tuple(arima_order)
+    ds, y = load_daily_demand_arrays(product_id)
+    logger.debug("Loaded %d days of demand for SKU: %s", len(ds), product_sku)
+    if not len(ds):
+        logger.warning("No transaction data for SKU '%s'.", product_sku)
+        return _no_history_result()
+    try:
+        logger.debug(
+            "Calling forecast_demand_arima with SKU: %s, horizon: %s, order: %s",
+            product_sku,
+            horizon,
+            arima_order,
+        )
+        forecast = forecast_demand_arima(
+            product_sku, ds, y, horizon, arima_order=arima_order
+        )
+        forecast_list = forecast_records(forecast)
+        logger.info(
+            "ARIMA forecast generated successfully for SKU: %s, horizon: %s, order: %s",
+            product_sku,
+            horizon,
+            arima_order,
+        )
+        response_data = {
+            "product_details": product_details,
+            "forecast": forecast_list,
+            "arima_order_used": arima_order,
+        }
+        cache_response(cache_key, response_data)
+        return _result(response_data)
+    except Exception as e:
+        logger.error(
+            "ARIMA forecasting failed for SKU %s, order: %s. Error: %s",
+            product_sku,
+            arima_order,
+            e,
+            exc_info=True,
+        )
+        return _result(
+            {"error": f"ARIMA forecasting failed: {str(e)}"},
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@shared_task
+def run_prophet_backtest(
+    product_id, product_sku, product_details, validation_horizon, cache_key
+):
+    """Backtests Prophet on a product's transaction history.
+
+    Args:
+        product_id (int): The primary key of the product.
+        product_sku (str): The SKU identifier of the product.
+        product_details (dict): The product's 'name' and 'description', echoed in the response.
+        validation_horizon (int): The number of trailing periods held out for validation.
+        cache_key (str): The key the successful response is cached under.
+
+    Returns:
+        dict: The response body under 'data' and its HTTP status code under 'status'."""
+    try:
+        df = load_daily_demand_df(product_id)
+        if df.empty:
+            return _no_history_result()
+        backtest_results = backtest_prophet_forecast(
+            product_sku, df, validation_horizon
+        )
+        if "error" in backtest_results:
+            return _result(
+                {"error": backtest_results["error"]}, status.HTTP_400_BAD_REQUEST
+            )
+        response_data = {
+            "product_details": product_details,
+            "metrics": backtest_results["metrics"],
+            "forecast": backtest_results["forecast"],
+        }
+        cache_response(cache_key, response_data)
+        return _result(response_data)
+    except Exception as e:
+        logger.exception(
+            "Prophet backtesting API error for SKU %s, horizon: %s. Error: %s",
+            product_sku,
+            validation_horizon,
+            e,
+            exc_info=True,
+        )
+        return _result(
+            {"error": f"Prophet backtesting failed: {str(e)}"},
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@shared_task
+def run_arima_backtest(
+    product_id, product_sku, product_details, validation_horizon, arima_order, cache_key
+):
+    """Backtests ARIMA on a product's transaction history.
+
+    Args:
+        product_id (int): The primary key of the product.
+        product_sku (str): The SKU identifier of the product.
+        product_details (dict): The product's 'name' and 'description', echoed in the response.
+        validation_horizon (int): The number of trailing periods held out for validation.
+        arima_order (tuple): The ARIMA (p, d, q) order.
+        cache_key (str): The key the successful response is cached under.
+
+    Returns:
+        dict: The response body under 'data' and its HTTP status code under 'status'."""
+    arima_order = tuple(arima_order)
+    try:
+        ds, y = load_daily_demand_arrays(product_id)
+        if not len(ds):
+            return _no_history_result()
+        backtest_results = backtest_arima_forecast(
+            product_sku, ds, y, validation_horizon, arima_order=arima_order
+        )
+        if "error" in backtest_results:
+            return _result(
+                {"error": backtest_results["error"]}, status.HTTP_400_BAD_REQUEST
+            )
+        response_data = {
+            "product_details": product_details,
+            "metrics": backtest_results["metrics"],
+            "forecast": backtest_results["forecast"],
+            "arima_order_used": backtest_results["arima_order_used"],
+        }
+        cache_response(cache_key, response_data)
+        return _result(response_data)
+    except Exception as e:
+        logger.error(
+            "ARIMA backtesting API error for SKU %s, horizon: %s, order: %s. Error: %s",
+            product_sku,
+            validation_horizon,
+            arima_order,
+            e,
+            exc_info=True,
+        )
+        return _result(
+            {"error": f"ARIMA backtesting failed: {str(e)}"},
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+from .forecast_fast import forecast_demand_holt_winters, holt_winters, use_holt_winters
+
+
+class HoltWintersTest(SimpleTestCase):
+    def test_repeats_a_flat_weekly_pattern(self):
+        """Test that a series repeating one week exactly is forecast as that same week."""
+        week = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+        yhat, yhat_lower, yhat_upper = holt_winters(
+            np.tile(week, 4), 7, 0.3, 0.05, 0.1, 7
+        )
+        np.testing.assert_allclose(yhat, week)
+        np.testing.assert_allclose(yhat_lower, week)
+        np.testing.assert_allclose(yhat_upper, week)
+
+    def test_forecast_starts_the_day_after_the_history(self):
+        """Test that the forecast records cover the requested days following the last observation."""
+        history = pd.DataFrame(
+            {
+                "transaction_date": pd.date_range("2026-01-01", periods=28, freq="D"),
+                "quantity": np.arange(28) % 7 + 1,
+            }
+        )
+        forecast = forecast_demand_holt_winters("SKU-1", history, 3)
+        self.assertEqual(
+            [record["ds"] for record in forecast],
+            ["2026-01-29T00:00:00", "2026-01-30T00:00:00", "2026-01-31T00:00:00"],
+        )
+
+    def test_routes_only_short_forecasts(self):
+        """Test that the fast path needs a short horizon and between two seasons and 500 days of history."""
+        self.assertTrue(use_holt_winters(30, 100))
+        self.assertFalse(use_holt_winters(31, 100))
+        self.assertFalse(use_holt_winters(30, 13))
+        self.assertFalse(use_holt_winters(30, 500))
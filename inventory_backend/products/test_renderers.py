@@ -0,0 +1,27 @@
+from decimal import Decimal
+import json
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    def test_renders_numpy_values(self):
+        """Test that NumPy arrays and scalars from the forecast code are serialized natively."""
+        rendered = ORJSONRenderer().render(
+            {"yhat": np.array([1.5, 2.5]), "mae": np.float64(0.25)}
+        )
+        self.assertEqual(json.loads(rendered), {"yhat": [1.5, 2.5], "mae": 0.25})
+
+    def test_falls_back_to_drf_encoder(self):
+        """Test that types orjson does not support are encoded the way DRF's JSONRenderer would.
+
+        Decimal totals from the dashboard aggregates and pandas Timestamps from the forecast
+        records go through DRF's encoder."""
+        rendered = ORJSONRenderer().render(
+            {"total": Decimal("12.50"), "ds": pd.Timestamp("2026-01-31")}
+        )
+        self.assertEqual(
+            json.loads(rendered), {"total": 12.5, "ds": "2026-01-31T00:00:00"}
+        )
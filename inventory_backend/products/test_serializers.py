@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase, TestCase
+from .factories import ProductFactory
+from .serializers import ProductSerializer
+
+
+class ProductSerializerUnitTest(SimpleTestCase):
+    def test_serializes_price_as_string(self):
+        """Test that the serializer renders the decimal price as a two-place string.
+
+        Serializes an unsaved product built by the factory, so neither the database nor the
+        HTTP stack is involved."""
+        data = ProductSerializer(ProductFactory.build()).data
+        self.assertEqual(data["price"], "10.99")
+
+    def test_serializes_read_only_reorder_point(self):
+        """Test that the read-only reorder point is included in the serialized output.
+
+        Uses an unsaved product built by the factory with an explicit reorder point."""
+        data = ProductSerializer(ProductFactory.build(reorder_point=25)).data
+        self.assertEqual(data["reorder_point"], 25)
+
+
+class ProductSerializerTest(TestCase):
+    def test_serializes_saved_product(self):
+        """Test that a saved product serializes with its name and database-assigned fields.
+
+        Replaces the former list-endpoint test: the same assertion on the product name is made
+        directly against the serializer, skipping URL dispatch and request parsing."""
+        product = ProductFactory(name="Test Product")
+        data = ProductSerializer(product).data
+        self.assertEqual(data["name"], "Test Product")
+        self.assertEqual(data["id"], product.id)
+        self.assertEqual(data["sku"], product.sku)
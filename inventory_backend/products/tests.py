@@ -1,73 +1,67 @@
+from datetime import datetime, timezone as dt_timezone
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.test import APIClient
-from .models import Product
+from transactions.models import Transaction
+from .factories import ProductFactory
+from .models import Counters, Product, ProductDailyDemand, ProductTransactionTotals
+
+# These classes deliberately use django.test.TestCase: each test is wrapped in a
+# transaction that is rolled back, which is far cheaper than the table flush
+# TransactionTestCase performs. Put tests that need real commits or multiple
+# connections in a separate TransactionTestCase subclass.
 
 
 class ProductModelTest(TestCase):
-    def setUp(self):
-        """Sets up the test environment by removing all existing Product entries and creating a single test product.
+    url = "/api/products/"
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates the single test product shared by every test in the class.
 
-        This method clears the Product database table to ensure a clean state before each test. It then creates a single Product instance with predefined attributes, which can be used in the test cases. Additionally, it sets the base URL for product API endpoints.
+        Runs once per class instead of before each test; TestCase rolls back any per-test
+        changes, so each test still sees the product in its original state.
 
         Attributes set:
-            self.product: The newly created Product instance used for testing.
-            self.url: The API endpoint URL for product-related requests."""
-        Product.objects.all().delete()
-        self.product = Product.objects.create(
-            name="Test Product",
-            description="Test Description",
-            price=10.99,
-            stock_level=100,
-            category="Test Category",
-        )
-        self.url = "/api/products/"
+            cls.product: The Product instance used for testing."""
+        cls.product = ProductFactory(name="Test Product")
 
     def test_product_creation(self):
         """Tests that a product instance is created with the correct attributes.
 
         Verifies that the product's name, price, stock level, and category match expected values,
-        and that the creation timestamp is set. Prints a confirmation message upon successful completion."""
+        and that the creation timestamp is set."""
         product = self.product
         self.assertEqual(product.name, "Test Product")
         self.assertEqual(product.price, 10.99)
         self.assertEqual(product.stock_level, 100)
         self.assertEqual(product.category, "Test Category")
         self.assertIsNotNone(product.created_at)
-        print("created")
 
     def test_product_str_method(self):
         """Test that the string representation of a Product instance returns the expected name.
 
         Verifies that calling str() on the product object returns the string 'Test Product'.
-        Assumes self.product is a Product instance initialized with the name 'Test Product'.
+        Uses an unsaved instance built by the factory, since __str__ does not need the database.
 
         No return value."""
-        product = self.product
+        product = ProductFactory.build(name="Test Product")
         self.assertEqual(str(product), "Test Product")
-        print("string")
 
 
 class ProductAPITest(TestCase):
-    def setUp(self):
-        """Sets up the test environment by clearing existing products and creating a single test product.
+    url = "/api/products/"
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates the single test product shared by every API test in the class.
 
-        This method is called before each test method to ensure a consistent starting state.
-        It deletes all existing Product records, then creates a new Product instance with predefined attributes.
-        Additionally, it sets the base URL for product-related API endpoints.
+        Tests that create or delete products run inside TestCase's per-test transaction,
+        so their changes are rolled back before the next test.
 
         Attributes set:
-        - self.product: the newly created Product instance.
-        - self.url: the API endpoint URL string for products."""
-        Product.objects.all().delete()
-        self.product = Product.objects.create(
-            name="Test Product",
-            description="Test Description",
-            price=10.99,
-            stock_level=100,
-            category="Test Category",
-        )
-        self.url = "/api/products/"
+        - cls.product: the Product instance used for testing."""
+        cls.product = ProductFactory(name="Test Product")
 
     def test_create_product(self):
         """Test creating a new product through the API endpoint.
@@ -86,21 +80,6 @@ class ProductAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["name"], data["name"])
         self.assertEqual(response.data["price"], str(data["price"]))
-        print("created")
-
-    def test_get_product(self):
-        """Test retrieving product details through the API.
-
-        Makes a GET request to the product endpoint and verifies that the response status is 200 OK,
-        exactly one product is returned, and the product name matches the expected product.
-
-        Returns:
-            None"""
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["name"], self.product.name)
-        print("get")
 
     def test_delete_product(self):
         """Test that a product can be successfully deleted via the API.
@@ -113,4 +92,90 @@ class ProductAPITest(TestCase):
         response = self.client.delete(f"{self.url}{self.product.id}/")
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Product.objects.filter(id=self.product.id).exists())
-        print("delete")
+
+
+class ProductDailyDemandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Creates the product whose transactions feed the daily demand table.
+
+        Attributes set:
+            cls.product: The Product instance used for testing."""
+        cls.product = ProductFactory()
+
+    def _create_transaction(self, quantity, hour):
+        return Transaction.objects.create(
+            product=self.product,
+            transaction_type="sale",
+            quantity=quantity,
+            transaction_date=datetime(2026, 1, 31, hour, tzinfo=dt_timezone.utc),
+            transaction_id=f"TXN-{hour}",
+        )
+
+    def test_transactions_on_same_day_are_summed(self):
+        """Two transactions on one UTC day produce a single row holding their combined quantity."""
+        self._create_transaction(3, hour=9)
+        self._create_transaction(4, hour=17)
+        daily = ProductDailyDemand.objects.get(product=self.product)
+        self.assertEqual(daily.day.isoformat(), "2026-01-31")
+        self.assertEqual(daily.quantity, 7)
+
+    def test_deleting_last_transaction_removes_row(self):
+        """Deleting the only transaction of a day removes that day's row."""
+        self._create_transaction(3, hour=9).delete()
+        self.assertFalse(ProductDailyDemand.objects.filter(product=self.product).exists())
+
+    def test_moving_transaction_to_another_day_refreshes_both_rows(self):
+        """Editing a transaction's date moves its quantity from the old day's row to the new one."""
+        transaction = self._create_transaction(3, hour=9)
+        transaction.transaction_date = datetime(2026, 2, 1, 9, tzinfo=dt_timezone.utc)
+        transaction.save()
+        daily = ProductDailyDemand.objects.get(product=self.product)
+        self.assertEqual(daily.day.isoformat(), "2026-02-01")
+        self.assertEqual(daily.quantity, 3)
+
+
+class ProductTransactionTotalsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Creates the product whose transactions feed the dashboard totals table.
+
+        Attributes set:
+            cls.product: The Product instance used for testing."""
+        cls.product = ProductFactory()
+
+    def _create_transaction(self, transaction_type, quantity, transaction_id):
+        return Transaction.objects.create(
+            product=self.product,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            unit_price=2,
+            transaction_date=datetime(2026, 1, 31, 9, tzinfo=dt_timezone.utc),
+            transaction_id=transaction_id,
+        )
+
+    def test_sales_and_purchases_are_totalled(self):
+        """Sales and purchases land in separate totals, and only sales are counted."""
+        self._create_transaction("sale", 3, "TXN-1")
+        self._create_transaction("purchase", 5, "TXN-2")
+        totals = ProductTransactionTotals.objects.get(product=self.product)
+        self.assertEqual(totals.total_sales, 6)
+        self.assertEqual(totals.total_cost, 10)
+        self.assertEqual(totals.sales_count, 1)
+
+    def test_deleting_last_transaction_removes_row(self):
+        """Deleting a product's only transaction removes its totals row."""
+        self._create_transaction("sale", 3, "TXN-1").delete()
+        self.assertFalse(
+            ProductTransactionTotals.objects.filter(product=self.product).exists()
+        )
+
+
+class CountersTest(TestCase):
+    def test_products_are_counted(self):
+        """Creating and deleting products moves the product counter without a COUNT query."""
+        product = ProductFactory()
+        ProductFactory()
+        self.assertEqual(Counters.objects.current().products_total, 2)
+        product.delete()
+        self.assertEqual(Counters.objects.current().products_total, 1)
@@ -1,13 +1,40 @@
+import logging
 from typing import TYPE_CHECKING
 from datetime import date, timedelta
+from functools import lru_cache
+from django.db.models import StdDev
 from django.utils import timezone
 import numpy as np
+import pandas as pd
+from scipy.stats import norm
 from transactions.models import Transaction
+from products.forecast import forecast_demand_arima
 from suppliers.models import Supplier
 
 if TYPE_CHECKING:
     from products.models import Product
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=32)
+def _z_score(service_level: float) -> float:
+    """Returns the standard normal quantile for a service level, memoized per level."""
+    return float(norm.ppf(service_level))
+
+
+def _lead_time_days(product: "Product") -> int:
+    """Returns the supplier lead time for a product, defaulting to 7 days without a supplier."""
+    return product.supplier.lead_time_days if product.supplier else 7
+
+
+def _reorder_point(
+    forecasted_demand: float, demand_std_dev: float, service_level: float
+) -> int:
+    """Combines forecasted demand and safety stock into a non-negative integer reorder point."""
+    safety_stock = _z_score(service_level) * demand_std_dev
+    return max(0, int(forecasted_demand + safety_stock))
+
 
 def calculate_reorder_point(product: "Product", service_level: float = 0.95) -> int:
     """Calculates the reorder point for a product based on forecasted demand, demand variability, and desired service level.
@@ -18,41 +45,169 @@ def calculate_reorder_point(product: "Product", service_level: float = 0.95) ->
 
     Returns:
         int: The reorder point as an integer, representing the inventory level at which a new order should be placed to maintain the desired service level."""
-    lead_time_days = product.supplier.lead_time_days if product.supplier else 7
+    lead_time_days = _lead_time_days(product)
     forecasted_demand = get_forecasted_demand(product, lead_time_days)
     demand_std_dev = get_demand_std_dev(product, lead_time_days)
-    from scipy.stats import norm
+    return _reorder_point(forecasted_demand, demand_std_dev, service_level)
+
+
+def calculate_reorder_points_bulk(
+    products: "list[Product]", service_level: float = 0.95
+) -> "dict[str, int]":
+    """Calculates reorder points for many products at once.
+
+    Args:
+        products: The Product instances for which to calculate reorder points.
+        service_level: The target probability (between 0 and 1) of not experiencing a stockout during the supplier lead time. Defaults to 0.95.
 
-    z_score = norm.ppf(service_level)
-    safety_stock = z_score * demand_std_dev
-    reorder_point = forecasted_demand + safety_stock
-    return max(0, int(reorder_point))
+    Returns:
+        dict: Reorder points keyed by product SKU."""
+    lead_times = {product.sku: _lead_time_days(product) for product in products}
+    forecasted_demands = get_forecasted_demand_bulk(products, lead_times)
+    return {
+        product.sku: _reorder_point(
+            forecasted_demands.get(product.sku, 0),
+            get_demand_std_dev(product, lead_times[product.sku]),
+            service_level,
+        )
+        for product in products
+    }
 
 
 def get_forecasted_demand(product: "Product", lead_time_days: int) -> float:
-    """Fetch the forecasted demand for a product over a specified lead time using an external API.
+    """Forecast the total demand for a product over a specified lead time with the ARIMA model.
+
+    Calls the forecasting code in-process rather than going through the forecast API. Results are
+    memoized per product and lead time until the product's demand history changes.
 
     Args:
         product (Product): Product instance with a 'sku' attribute identifying the product.
         lead_time_days (int): Number of days ahead for which to forecast demand.
 
     Returns:
-        float: Total forecasted demand summed over the lead time period. Returns 0 if the API request fails or the response cannot be parsed."""
-    import requests
+        float: Total forecasted demand summed over the lead time period. Returns 0 if the product has
+            no transaction history or forecasting fails."""
+    from products.models import ProductDailyDemand
 
     try:
-        forecast_api_url = f"http://localhost:8000/api/products/{product.sku}/forecast/arima/{lead_time_days}/"
-        response = requests.get(forecast_api_url)
-        response.raise_for_status()
-        forecast_data = response.json()
-        total_demand = sum(item["yhat"] for item in forecast_data["forecast"])
-        return total_demand
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching forecast: {e}")
+        return _forecast_total_demand(
+            product.pk,
+            product.sku,
+            lead_time_days,
+            ProductDailyDemand.objects.version(product.pk),
+        )
+    except Exception as e:
+        logger.warning("forecast failed for SKU %s: %s", product.sku, e)
         return 0
-    except KeyError as e:
-        print(f"KeyError in parsing forecast API response {e}")
+
+
+@lru_cache(maxsize=256)
+def _daily_demand_rows(product_id: int, version: int) -> np.ndarray:
+    """Reads a product's daily demand rows, oldest first, into one read-only structured array.
+
+    Memoized per product and history version, so a forecast and a backtest of the same product
+    share one database read. The memo is per process; the version is read from the database on
+    every call, so each process drops its entry as soon as any process commits a change.
+
+    Args:
+        product_id (int): The primary key of the product.
+        version (int): The product's demand history version from
+            ProductDailyDemand.objects.version(); any saved, edited or deleted transaction
+            changes it.
+
+    Returns:
+        numpy.ndarray: Rows with 'day' (datetime64[D]) and 'quantity' (int64) fields."""
+    from products.models import ProductDailyDemand
+
+    daily_demand = (
+        ProductDailyDemand.objects.filter(product_id=product_id)
+        .order_by("day")
+        .values_list("day", "quantity")
+    )
+    rows = np.fromiter(
+        daily_demand.iterator(chunk_size=5000),
+        dtype=[("day", "datetime64[D]"), ("quantity", "int64")],
+    )
+    rows.flags.writeable = False
+    return rows
+
+
+def _load_daily_demand_rows(product_id: int) -> np.ndarray:
+    """Returns a product's cached daily demand rows, re-reading them after its transactions change."""
+    from products.models import ProductDailyDemand
+
+    return _daily_demand_rows(
+        product_id, ProductDailyDemand.objects.version(product_id)
+    )
+
+
+def load_daily_demand_arrays(product_id: int) -> "tuple[np.ndarray, np.ndarray]":
+    """Loads a product's daily demand history, oldest first, as the NumPy arrays ARIMA fits on.
+
+    The arrays are the cached ones and read-only; no DataFrame is built.
+
+    Args:
+        product_id (int): The primary key of the product.
+
+    Returns:
+        tuple: The days as datetime64[D] and the quantities as int64; both empty if the product
+            has no transactions."""
+    rows = _load_daily_demand_rows(product_id)
+    return rows["day"], rows["quantity"]
+
+
+def load_daily_demand_df(product_id: int) -> pd.DataFrame:
+    """Loads a product's daily demand history, oldest first, as a DataFrame for forecasting.
+
+    Rows are streamed from the ProductDailyDemand table in chunks straight into one structured
+    NumPy array, so no per-row dicts or tuples accumulate. The array is cached until the
+    product's demand history version changes; each call builds a fresh DataFrame from copies of its columns.
+
+    Args:
+        product_id (int): The primary key of the product.
+
+    Returns:
+        pandas.DataFrame: A DataFrame with 'transaction_date' (the day) and 'quantity' columns;
+            empty if the product has no transactions."""
+    rows = _load_daily_demand_rows(product_id)
+    return pd.DataFrame(
+        {
+            "transaction_date": rows["day"].astype("datetime64[ns]"),
+            "quantity": rows["quantity"].copy(),
+        }
+    )
+
+
+@lru_cache(maxsize=256)
+def _forecast_total_demand(
+    product_id: int, product_sku: str, lead_time_days: int, version: int
+) -> float:
+    """Fits the ARIMA model on a product's daily demand history and sums the forecast.
+
+    `version` is only part of the cache key; any saved, edited or deleted transaction of the
+    product moves it on, so the entry is never reused for a changed history."""
+    ds, y = load_daily_demand_arrays(product_id)
+    if not len(y):
         return 0
+    forecast = forecast_demand_arima(product_sku, ds, y, lead_time_days)
+    return float(forecast["yhat"].sum())
+
+
+def get_forecasted_demand_bulk(
+    products: "list[Product]", lead_times: "dict[str, int]"
+) -> "dict[str, float]":
+    """Forecast the total demand for several products over their lead times.
+
+    Args:
+        products (list[Product]): Product instances with a 'sku' attribute identifying each product.
+        lead_times (dict[str, int]): Number of days ahead to forecast, keyed by product SKU.
+
+    Returns:
+        dict[str, float]: Total forecasted demand over each product's lead time, keyed by SKU."""
+    return {
+        product.sku: get_forecasted_demand(product, lead_times[product.sku])
+        for product in products
+    }
 
 
 def get_demand_std_dev(product: "Product", lead_time_days: int) -> float:
@@ -67,11 +222,10 @@ def get_demand_std_dev(product: "Product", lead_time_days: int) -> float:
                returns a default value of 5 if no sales data is available."""
     end_date = timezone.now()
     start_date = end_date - timedelta(days=90)
-    sales_data = Transaction.objects.filter(
-        product=product, transaction_date__range=[start_date, end_date]
-    ).values_list("quantity", flat=True)
-    if sales_data:
-        demand_std_dev = np.std(sales_data)
-        return demand_std_dev
+    demand_std_dev = Transaction.objects.filter(
+        product_id=product.pk, transaction_date__range=[start_date, end_date]
+    ).aggregate(std_dev=StdDev("quantity"))["std_dev"]
+    if demand_std_dev is not None:
+        return float(demand_std_dev)
     else:
         return 5
@@ -1,34 +1,81 @@
 from django.shortcuts import render
+from django.http import StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status
 from rest_framework import viewsets
 from .models import Product
 from .serializers import ProductSerializer
-from django.db.models import Sum, Count
+from django.db.models import Sum, Count, Q
 
 
 class ProductViewSet(viewsets.ModelViewSet):
-    queryset = Product.objects.all()
+    queryset = Product.objects.select_related("supplier")
     serializer_class = ProductSerializer
 
+    def list(self, request, *args, **kwargs):
+        """Lists products, serving repeat requests for the same page and filters from the cache.
+
+        The cached lists are invalidated by products.signals.invalidate_product_list whenever a
+        product or its stock level changes.
+
+        Args:
+            request (Request): The HTTP request.
+            *args: Positional arguments passed on to ModelViewSet.list.
+            **kwargs: Keyword arguments passed on to ModelViewSet.list.
+
+        Returns:
+            Response: The serialized products."""
+        cache_key = product_list_cache_key(request.get_full_path())
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, PRODUCT_LIST_CACHE_TIMEOUT)
+        return Response(data)
+
 
 from django.db.models.functions import TruncMonth
 from django.db import models
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from products.models import Product
+from products.models import (
+    Counters,
+    Product,
+    ProductDailyDemand,
+    ProductTransactionTotals,
+)
 from transactions.models import Transaction
-from .forecast import (
-    forecast_demand_prophet,
-    forecast_demand_arima,
-    backtest_prophet_forecast,
-    backtest_arima_forecast,
+from rest_framework.reverse import reverse
+from celery.result import AsyncResult
+from joblib import Parallel, delayed
+from .forecast import forecast_arima_records
+from .tasks import (
+    DEMAND_FORECASTERS,
+    run_demand_forecast,
+    run_arima_forecast,
+    run_prophet_backtest,
+    run_arima_backtest,
+    read_queryset_df,
+    get_cached_response,
 )
+from django.core.cache import cache
+from .signals import product_cache_key, product_list_cache_key
+import orjson
 import pandas as pd
+import hashlib
 import logging
+import re
+from functools import lru_cache
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 
 logger = logging.getLogger(__name__)
+PRODUCT_CACHE_TIMEOUT = 300
+PRODUCT_LIST_CACHE_TIMEOUT = 60
+DASHBOARD_CACHE_TIMEOUT = 60
+FORECAST_N_JOBS = -1
+STREAMING_FORECAST_HORIZON = 365
+STREAMING_CHUNK_RECORDS = 1000
+_ARIMA_RE = re.compile(r"^\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*$")
 ForecastItemSchema = {
     "type": "object",
     "properties": {
@@ -47,7 +94,220 @@ MetricsSchema = {
 }
 
 
+def _get_product(product_sku):
+    """Fetches the product columns the forecast views need, served from the cache when possible.
+
+    The cached copy is dropped by the Product post_save/post_delete signal handlers.
+
+    Args:
+        product_sku (str): The SKU identifier of the product.
+
+    Returns:
+        Product: The product, with only 'id', 'sku', 'name' and 'description' loaded.
+
+    Raises:
+        Product.DoesNotExist: If no product has the given SKU."""
+    return cache.get_or_set(
+        product_cache_key(product_sku),
+        lambda: Product.objects.only("id", "sku", "name", "description").get(
+            sku=product_sku
+        ),
+        timeout=PRODUCT_CACHE_TIMEOUT,
+    )
+
+
+def _forecast_cache_key(model, product, *params):
+    """Builds the cache key for a forecast or backtest response.
+
+    The key embeds the version of the product's demand history, which the Transaction signals
+    move on whenever a transaction is recorded, edited or deleted, so earlier cached responses
+    become unreachable without explicit invalidation.
+
+    Args:
+        model (str): Short name of the forecasting endpoint, e.g. 'prophet' or 'arima_backtest'.
+        product (Product): The product being forecast.
+        *params: Request parameters that change the result, such as the horizon or ARIMA order.
+
+    Returns:
+        str: The cache key."""
+    return ":".join(
+        [
+            "fc",
+            model,
+            product.sku,
+            *(str(param) for param in params),
+            str(ProductDailyDemand.objects.version(product.id)),
+        ]
+    )
+
+
+@lru_cache(maxsize=128)
+def _parse_arima_order(arima_order_str, default=(5, 1, 0)):
+    """Parses an ARIMA order given as 'p,d,q', falling back to a default when none is given.
+
+    Validation and extraction are one match against _ARIMA_RE, memoized because clients reuse a
+    handful of orders.
+
+    Args:
+        arima_order_str (str|None): Comma-separated ARIMA order, or None for the default.
+        default (tuple, optional): The order used when no string is given. Defaults to (5, 1, 0).
+
+    Returns:
+        tuple|None: The (p, d, q) order, or None if the string is not three comma-separated
+            non-negative integers."""
+    if not arima_order_str:
+        return default
+    match = _ARIMA_RE.match(arima_order_str)
+    if match is None:
+        return None
+    return int(match[1]), int(match[2]), int(match[3])
+
+
+def _run_forecast_task(request, task, *args):
+    """Runs a forecasting task in-process, or queues it on Celery when the client asks for it.
+
+    Passing '?async=true' makes the view return HTTP 202 straight away with the task id and the
+    URL to poll for the result, instead of holding the request open while the model fits.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        task (celery.Task): One of the tasks in products.tasks.
+        *args: Arguments for the task.
+
+    Returns:
+        Response: The task's response, or HTTP 202 with 'task_id' and 'result_url' when queued."""
+    if request.query_params.get("async", "").lower() in ("1", "true"):
+        result = task.delay(*args)
+        return Response(
+            {
+                "task_id": result.id,
+                "result_url": reverse(
+                    "forecast_result", args=[result.id], request=request
+                ),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+    result = task(*args)
+    return Response(result["data"], status=result["status"])
+
+
+def _forecast_window(request):
+    """Reads the optional 'offset' and 'limit' query parameters selecting a slice of a forecast.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        tuple: (offset, limit); limit is None when the rest of the forecast is wanted.
+
+    Raises:
+        ValueError: If either parameter is not a non-negative integer."""
+    offset = int(request.query_params.get("offset", 0))
+    limit = request.query_params.get("limit")
+    limit = None if limit is None else int(limit)
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must not be negative")
+    return offset, limit
+
+
+def _forecast_etag(cache_key, window):
+    """Builds the ETag of a forecast slice.
+
+    The cache key already carries the product's transaction version and the request parameters,
+    so the ETag changes whenever the forecast would.
+
+    Args:
+        cache_key (str): The key built by _forecast_cache_key.
+        window (tuple): The (offset, limit) returned by _forecast_window.
+
+    Returns:
+        str: A quoted strong ETag."""
+    digest = hashlib.md5(f"{cache_key}:{window[0]}:{window[1]}".encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def _not_modified(request, etag):
+    """Returns HTTP 304 when the client already holds the forecast identified by the ETag.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        etag (str): The ETag built by _forecast_etag.
+
+    Returns:
+        Response|None: An empty 304 response, or None if the client must get the forecast."""
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def _stream_forecast_json(response_data):
+    """Yields a forecast response as JSON, encoding the forecast records a chunk at a time.
+
+    Args:
+        response_data (dict): The response body, with a 'forecast' list and at least one other key.
+
+    Yields:
+        bytes: Consecutive pieces of the JSON document."""
+    forecast = response_data["forecast"]
+    details = {key: value for key, value in response_data.items() if key != "forecast"}
+    yield orjson.dumps(details)[:-1] + b',"forecast":['
+    for start in range(0, len(forecast), STREAMING_CHUNK_RECORDS):
+        chunk = orjson.dumps(forecast[start : start + STREAMING_CHUNK_RECORDS])
+        yield (b"," if start else b"") + chunk[1:-1]
+    yield b"]}"
+
+
+def _forecast_response(response_data, window, etag):
+    """Returns the requested slice of a successful forecast, streamed when it is long.
+
+    Slices longer than STREAMING_FORECAST_HORIZON records can run to megabytes; streaming them
+    sends the first bytes sooner and never holds the whole encoded document in memory.
+
+    Args:
+        response_data (dict): The response body, with a 'forecast' list.
+        window (tuple): The (offset, limit) returned by _forecast_window.
+        etag (str): The ETag built by _forecast_etag.
+
+    Returns:
+        HttpResponse: A StreamingHttpResponse for long slices, otherwise a DRF Response."""
+    offset, limit = window
+    end = None if limit is None else offset + limit
+    response_data = {**response_data, "forecast": response_data["forecast"][offset:end]}
+    if len(response_data["forecast"]) <= STREAMING_FORECAST_HORIZON:
+        response = Response(response_data, status=status.HTTP_200_OK)
+    else:
+        response = StreamingHttpResponse(
+            _stream_forecast_json(response_data), content_type="application/json"
+        )
+    response["ETag"] = etag
+    return response
+
+
 @extend_schema(
+    parameters=[
+        OpenApiParameter(
+            "model",
+            OpenApiTypes.STR,
+            OpenApiParameter.QUERY,
+            required=False,
+            enum=list(DEMAND_FORECASTERS),
+            description="Forecasting model; defaults to 'statsforecast' (AutoARIMA).",
+        ),
+        OpenApiParameter(
+            "offset",
+            OpenApiTypes.INT,
+            OpenApiParameter.QUERY,
+            required=False,
+            description="Index of the first forecast record to return; defaults to 0.",
+        ),
+        OpenApiParameter(
+            "limit",
+            OpenApiTypes.INT,
+            OpenApiParameter.QUERY,
+            required=False,
+            description="Maximum number of forecast records to return; defaults to all.",
+        ),
+    ],
     responses={
         (200): {
             "type": "object",
@@ -62,14 +322,19 @@ MetricsSchema = {
                 "forecast": {"type": "array", "items": ForecastItemSchema},
             },
         },
+        (304): None,
+        (400): OpenApiTypes.OBJECT,
         (404): OpenApiTypes.OBJECT,
         (500): OpenApiTypes.OBJECT,
     },
-    description="Retrieves a demand forecast for a product using Prophet.",
+    description="Retrieves a demand forecast for a product using StatsForecast AutoARIMA or Prophet.",
 )
 @api_view(["GET"])
 def get_demand_forecast(request, product_sku, horizon):
-    """Retrieve a demand forecast for a specified product over a given time horizon using the Prophet model.
+    """Retrieve a demand forecast for a specified product over a given time horizon.
+
+    The model is StatsForecast's AutoARIMA unless the 'model' query parameter selects 'prophet'.
+    Prophet requests of up to 30 days on a short history are answered by Holt-Winters smoothing.
 
     Args:
         request (HttpRequest): The HTTP request object.
@@ -79,53 +344,57 @@ def get_demand_forecast(request, product_sku, horizon):
     Returns:
         Response: A DRF Response object containing either:
             - HTTP 200 with a JSON payload including product details and forecast data,
+            - HTTP 400 if the requested model is unknown,
             - HTTP 404 if the product or its historical transaction data is not found,
-            - HTTP 500 if an error occurs during forecasting or unexpected exceptions are raised.
+            - HTTP 500 if an error occurs during forecasting or unexpected exceptions are raised,
+            - HTTP 202 with a task id when called with '?async=true',
+            - HTTP 304 if the client's If-None-Match holds the current ETag.
+        The 'offset' and 'limit' query parameters select a slice of the forecast; slices longer
+        than STREAMING_FORECAST_HORIZON records are streamed.
 
-    This view queries transaction data for the product, prepares it for time series forecasting,
-    calls the Prophet-based forecast function, and handles potential errors gracefully."""
-    try:
-        product = Product.objects.get(sku=product_sku)
-    except Product.DoesNotExist:
+    This view looks up the product and returns a cached forecast when one exists; otherwise the
+    fit runs in the run_demand_forecast task, inline or on a Celery worker."""
+    model = request.query_params.get("model", "statsforecast")
+    if model not in DEMAND_FORECASTERS:
         return Response(
-            {"error": "Product not found."}, status=status.HTTP_404_NOT_FOUND
+            {"error": f"Unknown model. Choose one of: {', '.join(DEMAND_FORECASTERS)}."},
+            status=status.HTTP_400_BAD_REQUEST,
         )
     try:
-        queryset = Transaction.objects.filter(product__sku=product_sku).order_by(
-            "transaction_date"
-        )
-        transactions = list(queryset.values("transaction_date", "quantity"))
-        for transaction in transactions:
-            if transaction["transaction_date"]:
-                transaction["transaction_date"] = transaction[
-                    "transaction_date"
-                ].replace(tzinfo=None)
-        df = pd.DataFrame(transactions)
-        if df.empty:
-            return Response(
-                {"error": "No historical transaction data found for this product."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        forecast = forecast_demand_prophet(product_sku, df, horizon)
-        if not forecast:
-            return Response(
-                {"error": "Forecast is empty due to an error during prediction."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-        product_details = {"name": product.name, "description": product.description}
+        window = _forecast_window(request)
+    except ValueError:
         return Response(
-            {"product_details": product_details, "forecast": forecast},
-            status=status.HTTP_200_OK,
-        )
-    except Exception as e:
-        logger.exception(
-            "An unexpected error occurred during the forecasting process.",
-            exc_info=True,
+            {"error": "offset and limit must be non-negative integers."},
+            status=status.HTTP_400_BAD_REQUEST,
         )
+    try:
+        product = _get_product(product_sku)
+    except Product.DoesNotExist:
         return Response(
-            {"error": f"An unexpected error occurred: {str(e)}"},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {"error": "Product not found."}, status=status.HTTP_404_NOT_FOUND
         )
+    cache_key = _forecast_cache_key(model, product, horizon)
+    etag = _forecast_etag(cache_key, window)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    cached_response = get_cached_response(cache_key)
+    if cached_response is not None:
+        return _forecast_response(cached_response, window, etag)
+    product_details = {"name": product.name, "description": product.description}
+    response = _run_forecast_task(
+        request,
+        run_demand_forecast,
+        product.id,
+        product_sku,
+        product_details,
+        horizon,
+        model,
+        cache_key,
+    )
+    if response.status_code == status.HTTP_200_OK:
+        return _forecast_response(response.data, window, etag)
+    return response
 
 
 @extend_schema(
@@ -151,6 +420,20 @@ def get_demand_forecast(request, product_sku, horizon):
             required=False,
             description="Optional ARIMA order as p,d,q (e.g., '5,1,0')",
         ),
+        OpenApiParameter(
+            "offset",
+            OpenApiTypes.INT,
+            OpenApiParameter.QUERY,
+            required=False,
+            description="Index of the first forecast record to return; defaults to 0.",
+        ),
+        OpenApiParameter(
+            "limit",
+            OpenApiTypes.INT,
+            OpenApiParameter.QUERY,
+            required=False,
+            description="Maximum number of forecast records to return; defaults to all.",
+        ),
     ],
     responses={
         (200): {
@@ -171,6 +454,7 @@ def get_demand_forecast(request, product_sku, horizon):
                 },
             },
         },
+        (304): None,
         (400): OpenApiTypes.OBJECT,
         (404): OpenApiTypes.OBJECT,
         (500): OpenApiTypes.OBJECT,
@@ -192,79 +476,171 @@ def get_arima_demand_forecast(request, product_sku, horizon, arima_order_str=Non
         Response: A DRF Response object containing product details and forecast results in case of success,
             or an error message with appropriate HTTP status code if the product is not found,
             transaction data is missing, ARIMA order format is invalid, or forecasting fails.
+        The 'offset' and 'limit' query parameters select a slice of the forecast, and a matching
+        If-None-Match header gets HTTP 304.
 
     Logs detailed information about the request processing, including data retrieval, parameter parsing,
     forecasting steps, and any errors encountered."""
     logger.info(
-        f"Starting ARIMA forecast API request for SKU: {product_sku}, horizon: {horizon}, order_str: {arima_order_str}"
+        "Starting ARIMA forecast API request for SKU: %s, horizon: %s, order_str: %s",
+        product_sku,
+        horizon,
+        arima_order_str,
     )
     try:
-        product = Product.objects.get(sku=product_sku)
+        product = _get_product(product_sku)
     except Product.DoesNotExist:
-        logger.warning(f"Product with SKU '{product_sku}' not found.")
+        logger.warning("Product with SKU '%s' not found.", product_sku)
         return Response({"error": "Product not found."}, status=404)
-    queryset = Transaction.objects.filter(product__sku=product_sku).order_by(
-        "transaction_date"
-    )
-    transactions = list(queryset.values("transaction_date", "quantity"))
-    logger.info(
-        f"Retrieved {len(transactions)} transactions from database for SKU: {product_sku}"
-    )
-    for transaction in transactions:
-        if transaction["transaction_date"]:
-            transaction["transaction_date"] = transaction["transaction_date"].replace(
-                tzinfo=None
-            )
-    df = pd.DataFrame(transactions)
-    logger.info(f"Pandas DataFrame created. Shape: {df.shape}")
-    if df.empty:
-        logger.warning(
-            f"No transaction data after DataFrame creation for SKU '{product_sku}'."
-        )
+    arima_order = _parse_arima_order(arima_order_str)
+    if arima_order is None:
+        logger.warning("Invalid arima_order format: %s", arima_order_str)
         return Response(
-            {"error": "No historical transaction data found for this product."},
-            status=404,
+            {"error": "Invalid arima_order format. Use 'p,d,q' (e.g., '2,1,2')."},
+            status=400,
         )
     try:
-        arima_order = 5, 1, 0
-        if arima_order_str:
-            try:
-                p, d, q = map(int, arima_order_str.split(","))
-                arima_order = p, d, q
-            except ValueError as ve:
-                logger.warning(
-                    f"Invalid arima_order format: {arima_order_str}. Error: {ve}"
-                )
-                return Response(
-                    {
-                        "error": "Invalid arima_order format. Use 'p,d,q' (e.g., '2,1,2')."
-                    },
-                    status=400,
-                )
-        logger.info(
-            f"Calling forecast_demand_arima with SKU: {product_sku}, horizon: {horizon}, order: {arima_order}, DataFrame shape: {df.shape}"
-        )
-        forecast = forecast_demand_arima(
-            product_sku, df, horizon, arima_order=arima_order
+        window = _forecast_window(request)
+    except ValueError:
+        return Response(
+            {"error": "offset and limit must be non-negative integers."}, status=400
         )
-        forecast_list = forecast.to_dict("records")
-        product_details = {"name": product.name, "description": product.description}
-        logger.info(
-            f"ARIMA forecast generated successfully for SKU: {product_sku}, horizon: {horizon}, order: {arima_order}"
+    cache_key = _forecast_cache_key(
+        "arima", product, horizon, "-".join(map(str, arima_order))
+    )
+    etag = _forecast_etag(cache_key, window)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    cached_response = get_cached_response(cache_key)
+    if cached_response is not None:
+        return _forecast_response(cached_response, window, etag)
+    product_details = {"name": product.name, "description": product.description}
+    response = _run_forecast_task(
+        request,
+        run_arima_forecast,
+        product.id,
+        product_sku,
+        product_details,
+        horizon,
+        arima_order,
+        cache_key,
+    )
+    if response.status_code == status.HTTP_200_OK:
+        return _forecast_response(response.data, window, etag)
+    return response
+
+
+@extend_schema(
+    request={
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "sku": {"type": "string"},
+                        "horizon": {"type": "integer"},
+                    },
+                },
+            },
+            "arima_order": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "example": [5, 1, 0],
+            },
+        },
+    },
+    responses={
+        (200): {
+            "type": "object",
+            "properties": {
+                "forecasts": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "array",
+                        "items": ForecastItemSchema,
+                    },
+                },
+                "errors": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string"},
+                },
+            },
+        },
+        (400): OpenApiTypes.OBJECT,
+    },
+    description="Retrieves ARIMA demand forecasts for several products in one request.",
+)
+@api_view(["POST"])
+def get_bulk_arima_demand_forecast(request):
+    """Generates ARIMA demand forecasts for several products, loading their daily demand history in one query.
+
+    Args:
+        request (HttpRequest): The HTTP request object. Its body holds 'items', a list of objects with
+            'sku' and 'horizon' keys, and an optional 'arima_order' list of three integers (defaults to 5,1,0).
+
+    The per-SKU fits run in parallel on joblib's loky backend. Its process pool is reused across
+    requests, so worker imports and per-process model caches survive between calls.
+
+    Returns:
+        Response: A DRF Response object containing 'forecasts', the forecast records keyed by SKU, and
+            'errors', an error message keyed by SKU for products that could not be forecast.
+            Returns HTTP 400 if the request body is malformed."""
+    items = request.data.get("items") if isinstance(request.data, dict) else None
+    if not isinstance(items, list):
+        return Response(
+            {"error": "'items' must be a list of {sku, horizon} objects."},
+            status=status.HTTP_400_BAD_REQUEST,
         )
+    try:
+        horizons = {item["sku"]: int(item["horizon"]) for item in items}
+        arima_order = tuple(map(int, request.data.get("arima_order", (5, 1, 0))))
+        if len(arima_order) != 3:
+            raise ValueError("arima_order must have three elements")
+    except (KeyError, TypeError, ValueError) as e:
         return Response(
-            {
-                "product_details": product_details,
-                "forecast": forecast_list,
-                "arima_order_used": arima_order,
-            }
+            {"error": f"Invalid bulk forecast request: {e}"},
+            status=status.HTTP_400_BAD_REQUEST,
         )
-    except Exception as e:
-        logger.error(
-            f"ARIMA forecasting failed for SKU {product_sku}, order: {arima_order}. Error: {e}",
-            exc_info=True,
+    queryset = ProductDailyDemand.objects.filter(product__sku__in=horizons).order_by(
+        "day"
+    )
+    df = read_queryset_df(
+        queryset.values_list("product__sku", "day", "quantity"),
+        ["product__sku", "transaction_date", "quantity"],
+    )
+    df["transaction_date"] = pd.to_datetime(df["transaction_date"])
+    history_by_sku = {
+        product_sku: (
+            group["transaction_date"].to_numpy(),
+            group["quantity"].to_numpy(),
+        )
+        for product_sku, group in df.groupby("product__sku")
+    }
+    errors = {
+        product_sku: "No historical transaction data found for this product."
+        for product_sku in horizons
+        if product_sku not in history_by_sku
+    }
+    skus = [product_sku for product_sku in horizons if product_sku in history_by_sku]
+    results = Parallel(n_jobs=FORECAST_N_JOBS, backend="loky")(
+        delayed(forecast_arima_records)(
+            product_sku,
+            *history_by_sku[product_sku],
+            horizons[product_sku],
+            arima_order,
         )
-        return Response({"error": f"ARIMA forecasting failed: {str(e)}"}, status=500)
+        for product_sku in skus
+    )
+    forecasts = {}
+    for product_sku, (forecast, error) in zip(skus, results):
+        if error is None:
+            forecasts[product_sku] = forecast
+        else:
+            errors[product_sku] = error
+    return Response({"forecasts": forecasts, "errors": errors})
 
 
 @extend_schema(
@@ -307,67 +683,37 @@ def get_prophet_backtesting(request, product_sku, validation_horizon):
     Raises:
         Does not raise exceptions directly; all errors are caught and returned as HTTP responses."""
     try:
-        product = Product.objects.get(sku=product_sku)
+        product = _get_product(product_sku)
     except Product.DoesNotExist:
         return Response(
             {"error": "Product not found."}, status=status.HTTP_404_NOT_FOUND
         )
     try:
-        queryset = Transaction.objects.filter(product__sku=product_sku).order_by(
-            "transaction_date"
-        )
-        transactions = list(queryset.values("transaction_date", "quantity"))
-        for transaction in transactions:
-            if transaction["transaction_date"]:
-                transaction["transaction_date"] = transaction[
-                    "transaction_date"
-                ].replace(tzinfo=None)
-        df = pd.DataFrame(transactions)
-        if df.empty:
-            return Response(
-                {"error": "No historical transaction data found for this product."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        try:
-            validation_horizon_int = int(validation_horizon)
-            if validation_horizon_int <= 0:
-                return Response(
-                    {"error": "Validation horizon must be a positive integer."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            backtest_results = backtest_prophet_forecast(
-                product_sku, df.copy(), validation_horizon_int
-            )
-            if "error" in backtest_results:
-                return Response(
-                    {"error": backtest_results["error"]},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            metrics = backtest_results["metrics"]
-            forecast_list = backtest_results["forecast"]
-            product_details = {"name": product.name, "description": product.description}
-            return Response(
-                {
-                    "product_details": product_details,
-                    "metrics": metrics,
-                    "forecast": forecast_list,
-                },
-                status=status.HTTP_200_OK,
-            )
-        except ValueError:
-            return Response(
-                {"error": "Invalid validation_horizon. Must be an integer."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-    except Exception as e:
-        logger.exception(
-            f"Prophet backtesting API error for SKU {product_sku}, horizon: {validation_horizon}. Error: {e}",
-            exc_info=True,
+        validation_horizon_int = int(validation_horizon)
+    except ValueError:
+        return Response(
+            {"error": "Invalid validation_horizon. Must be an integer."},
+            status=status.HTTP_400_BAD_REQUEST,
         )
+    if validation_horizon_int <= 0:
         return Response(
-            {"error": f"Prophet backtesting failed: {str(e)}"},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {"error": "Validation horizon must be a positive integer."},
+            status=status.HTTP_400_BAD_REQUEST,
         )
+    cache_key = _forecast_cache_key("prophet_backtest", product, validation_horizon)
+    cached_response = get_cached_response(cache_key)
+    if cached_response is not None:
+        return Response(cached_response, status=status.HTTP_200_OK)
+    product_details = {"name": product.name, "description": product.description}
+    return _run_forecast_task(
+        request,
+        run_prophet_backtest,
+        product.id,
+        product_sku,
+        product_details,
+        validation_horizon_int,
+        cache_key,
+    )
 
 
 @extend_schema(
@@ -438,82 +784,118 @@ def get_arima_backtesting(
 
     Logs detailed information about received parameters, data validation, and exceptions to aid debugging and monitoring."""
     logger.info(
-        f"ARIMA Backtesting API: Request Received - SKU: {product_sku}, horizon_str: {validation_horizon}, order_str: {arima_order_str}"
-    )
-    logger.info(
-        f"Value of validation_horizon at view entry: {validation_horizon}, Type: {type(validation_horizon)}"
+        "ARIMA Backtesting API: Request Received - SKU: %s, horizon: %r, order_str: %s",
+        product_sku,
+        validation_horizon,
+        arima_order_str,
     )
     try:
-        product = Product.objects.get(sku=product_sku)
+        product = _get_product(product_sku)
     except Product.DoesNotExist:
         return Response({"error": "Product not found."}, status=404)
-    queryset = Transaction.objects.filter(product__sku=product_sku).order_by(
-        "transaction_date"
-    )
-    transactions = list(queryset.values("transaction_date", "quantity"))
-    for transaction in transactions:
-        if transaction["transaction_date"]:
-            transaction["transaction_date"] = transaction["transaction_date"].replace(
-                tzinfo=None
-            )
-    df = pd.DataFrame(transactions)
-    if df.empty:
-        return Response(
-            {"error": "No historical transaction data found for this product."},
-            status=404,
-        )
     try:
         validation_horizon_int = int(validation_horizon)
-        logger.info(
-            f"Value of validation_horizon BEFORE int conversion: {validation_horizon}, Type: {type(validation_horizon)}"
-        )
-        if validation_horizon_int <= 0:
-            return Response(
-                {"error": "Validation horizon must be a positive integer."}, status=400
-            )
-        arima_order = 5, 1, 0
-        if arima_order_str:
-            try:
-                p, d, q = map(int, arima_order_str.split(","))
-                arima_order = p, d, q
-            except ValueError:
-                return Response(
-                    {
-                        "error": "Invalid arima_order format. Use 'p,d,q' (e.g., '2,1,2')."
-                    },
-                    status=400,
-                )
-        backtest_results = backtest_arima_forecast(
-            product_sku, df, validation_horizon_int, arima_order=arima_order
-        )
-        if "error" in backtest_results:
-            return Response({"error": backtest_results["error"]}, status=400)
-        metrics = backtest_results["metrics"]
-        forecast_list = backtest_results["forecast"]
-        arima_order_used = backtest_results["arima_order_used"]
-        product_details = {"name": product.name, "description": product.description}
-        return Response(
-            {
-                "product_details": product_details,
-                "metrics": metrics,
-                "forecast": forecast_list,
-                "arima_order_used": arima_order_used,
-            }
-        )
     except ValueError as ve:
         logger.error(
-            f"ValueError during int(validation_horizon): Value: '{validation_horizon}', Error: {ve}",
+            "ValueError during int(validation_horizon): Value: %r, Error: %s",
+            validation_horizon,
+            ve,
             exc_info=True,
         )
         return Response(
             {"error": "Invalid validation_horizon. Must be an integer."}, status=400
         )
-    except Exception as e:
-        logger.error(
-            f"ARIMA backtesting API error for SKU {product_sku}, horizon: {validation_horizon}, order: {arima_order}. Error: {e}",
-            exc_info=True,
+    if validation_horizon_int <= 0:
+        return Response(
+            {"error": "Validation horizon must be a positive integer."}, status=400
+        )
+    arima_order = _parse_arima_order(arima_order_str)
+    if arima_order is None:
+        return Response(
+            {"error": "Invalid arima_order format. Use 'p,d,q' (e.g., '2,1,2')."},
+            status=400,
+        )
+    cache_key = _forecast_cache_key(
+        "arima_backtest",
+        product,
+        validation_horizon_int,
+        "-".join(map(str, arima_order)),
+    )
+    cached_response = get_cached_response(cache_key)
+    if cached_response is not None:
+        return Response(cached_response)
+    product_details = {"name": product.name, "description": product.description}
+    return _run_forecast_task(
+        request,
+        run_arima_backtest,
+        product.id,
+        product_sku,
+        product_details,
+        validation_horizon_int,
+        arima_order,
+        cache_key,
+    )
+
+
+@extend_schema(
+    responses={
+        (200): OpenApiTypes.OBJECT,
+        (202): {
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string"},
+                "status": {"type": "string"},
+            },
+        },
+        (500): OpenApiTypes.OBJECT,
+    },
+    description="Retrieves the result of a forecast or backtest queued with '?async=true'.",
+)
+@api_view(["GET"])
+def get_forecast_result(request, task_id):
+    """Returns the outcome of a queued forecasting task.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        task_id (str): The id returned by a forecast or backtest endpoint called with '?async=true'.
+
+    Returns:
+        Response: HTTP 202 with the task state while it is still pending or running, HTTP 500 if the
+            task crashed, otherwise the response the synchronous endpoint would have returned."""
+    result = AsyncResult(task_id)
+    if not result.ready():
+        return Response(
+            {"task_id": task_id, "status": result.status},
+            status=status.HTTP_202_ACCEPTED,
         )
-        return Response({"error": f"ARIMA backtesting failed: {str(e)}"}, status=500)
+    if result.failed():
+        return Response(
+            {"error": f"Forecast task failed: {result.result}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+    return Response(result.result["data"], status=result.result["status"])
+
+
+def _compute_dashboard_metrics(product_filter):
+    """Aggregates the dashboard totals from the per-product ProductTransactionTotals rows.
+
+    Args:
+        product_filter (Q): Restricts the totals to one product, or an empty Q for all of them.
+
+    Returns:
+        dict: 'total_sales', 'total_profit', 'total_transactions' and 'total_products'."""
+    totals = ProductTransactionTotals.objects.filter(product_filter).aggregate(
+        total_sales=Sum("total_sales"),
+        total_cost=Sum("total_cost"),
+        total_transactions=Sum("sales_count"),
+    )
+    total_sales = totals["total_sales"] or 0
+    return {
+        "total_sales": total_sales,
+        "total_profit": total_sales - (totals["total_cost"] or 0),
+        "total_transactions": totals["total_transactions"] or 0,
+        "total_products": Counters.objects.current().products_total,
+    }
 
 
 @extend_schema(
@@ -558,39 +940,27 @@ def get_dashboard_metrics(request, product_sku=None):
 
     Returns:
         Response: A DRF Response object containing a JSON with keys 'total_sales', 'total_profit', 'total_transactions', and 'total_products'.
-                  Returns a 404 response if the product SKU does not exist, or a 500 response on other errors."""
+                  Returns a 404 response if the product SKU does not exist, or a 500 response on other errors.
+                  Metrics are cached for DASHBOARD_CACHE_TIMEOUT seconds, so they may lag new transactions by up to a minute."""
     try:
-        transaction_queryset = Transaction.objects.filter(transaction_type="sale")
+        product_filter = Q()
         if product_sku:
-            try:
-                product = Product.objects.get(sku=product_sku)
-            except Product.DoesNotExist:
+            product_id = (
+                Product.objects.filter(sku=product_sku)
+                .values_list("id", flat=True)
+                .first()
+            )
+            if product_id is None:
                 return Response({"error": "Product not found."}, status=404)
-            transaction_queryset = transaction_queryset.filter(product=product)
-        total_sales = (
-            transaction_queryset.aggregate(total=Sum("total_amount"))["total"] or 0
-        )
-        total_revenue = (
-            transaction_queryset.aggregate(total=Sum("total_amount"))["total"] or 0
+            product_filter = Q(product_id=product_id)
+        metrics = cache.get_or_set(
+            f"dashmetrics:{product_sku or 'all'}",
+            lambda: _compute_dashboard_metrics(product_filter),
+            timeout=DASHBOARD_CACHE_TIMEOUT,
         )
-        total_cost = (
-            Transaction.objects.filter(transaction_type="purchase").aggregate(
-                total=Sum("total_amount")
-            )["total"]
-            or 0
-        )
-        total_profit = total_revenue - total_cost
-        total_transactions = transaction_queryset.count()
-        total_products = Product.objects.count()
-        metrics = {
-            "total_sales": total_sales,
-            "total_profit": total_profit,
-            "total_transactions": total_transactions,
-            "total_products": total_products,
-        }
         return Response(metrics)
     except Exception as e:
-        logger.error(f"Error calculating dashboard metrics: {e}", exc_info=True)
+        logger.error("Error calculating dashboard metrics: %s", e, exc_info=True)
         return Response(
             {"error": f"Failed to calculate dashboard metrics: {str(e)}"}, status=500
         )
@@ -614,18 +984,29 @@ def get_dashboard_metrics(request, product_sku=None):
                 "properties": {
                     "month": {"type": "string", "format": "date"},
                     "total_sales": {"type": "number", "format": "float"},
+                    "total_cost": {"type": "number", "format": "float"},
                     "total_profit": {"type": "number", "format": "float"},
                 },
             },
             "example": [
-                {"month": "2024-01-01", "total_sales": 5000.0, "total_profit": 1200.5},
-                {"month": "2024-02-01", "total_sales": 7550.75, "total_profit": 1950.0},
+                {
+                    "month": "2024-01-01",
+                    "total_sales": 5000.0,
+                    "total_cost": 3100.0,
+                    "total_profit": 1200.5,
+                },
+                {
+                    "month": "2024-02-01",
+                    "total_sales": 7550.75,
+                    "total_cost": 4020.0,
+                    "total_profit": 1950.0,
+                },
             ],
         },
         (404): OpenApiTypes.OBJECT,
         (500): OpenApiTypes.OBJECT,
     },
-    description="Retrieves monthly sales and profit trend data, optionally filtered by product SKU.",
+    description="Retrieves monthly sales, purchase cost and profit trend data, optionally filtered by product SKU.",
 )
 @api_view(["GET"])
 def get_sales_profit_trend(request, product_sku=None):
@@ -639,38 +1020,46 @@ def get_sales_profit_trend(request, product_sku=None):
         Response: A JSON response containing a list of dictionaries, each with keys:
             - 'month' (datetime): The month of the transactions.
             - 'total_sales' (Decimal): Total sales amount for the month.
+            - 'total_cost' (Decimal): Total purchase amount for the month.
             - 'total_profit' (Decimal): Calculated profit for the month (sales revenue minus cost).
         If the product SKU does not exist, returns a 404 error response.
         On failure, returns a 500 error response with an error message."""
     try:
-        transaction_queryset = Transaction.objects.filter(transaction_type="sale")
-        purchase_queryset = Transaction.objects.filter(transaction_type="purchase")
+        transaction_queryset = Transaction.objects.filter(
+            transaction_type__in=["sale", "purchase"]
+        )
         if product_sku:
-            try:
-                product = Product.objects.get(sku=product_sku)
-            except Product.DoesNotExist:
+            product_id = (
+                Product.objects.filter(sku=product_sku)
+                .values_list("id", flat=True)
+                .first()
+            )
+            if product_id is None:
                 return Response({"error": "Product not found."}, status=404)
-            transaction_queryset = transaction_queryset.filter(product=product)
-            purchase_queryset = purchase_queryset.filter(product=product)
+            transaction_queryset = transaction_queryset.filter(product_id=product_id)
+        is_sale = Q(transaction_type="sale")
         sales_profit_data = (
             transaction_queryset.annotate(month=TruncMonth("transaction_date"))
             .values("month")
             .annotate(
-                total_sales=Sum("total_amount"),
+                total_sales=Sum("total_amount", filter=is_sale, default=0),
+                total_cost=Sum(
+                    "total_amount", filter=Q(transaction_type="purchase"), default=0
+                ),
                 total_profit=Sum(
                     models.F("total_amount")
-                    - models.F("unit_price") * models.F("quantity")
+                    - models.F("unit_price") * models.F("quantity"),
+                    filter=is_sale,
+                    default=0,
                 ),
             )
             .order_by("month")
         )
-        total_cost = (
-            purchase_queryset.aggregate(total=Sum("total_amount"))["total"] or 0
-        )
-        sales_profit_list = list(sales_profit_data)
-        return Response(sales_profit_list)
+        return Response(list(sales_profit_data))
     except Exception as e:
-        logger.error(f"Error calculating sales and profit trend: {e}", exc_info=True)
+        logger.error(
+            "Error calculating sales and profit trend: %s", e, exc_info=True
+        )
         return Response(
             {"error": f"Failed to calculate sales and profit trend: {str(e)}"},
             status=500,
@@ -0,0 +1,67 @@
+# Generated by Django 5.1 on 2026-10-15 17:35
+
+from django.db import migrations, models
+
+TEXT_FIELDS = [
+    "contact_name",
+    "contact_email",
+    "phone_number",
+    "address",
+    "payment_terms",
+    "notes",
+]
+
+
+def normalize_empty_values(apps, schema_editor):
+    Supplier = apps.get_model("suppliers", "Supplier")
+    for field in TEXT_FIELDS:
+        Supplier.objects.filter(**{f"{field}__isnull": True}).update(**{field: ""})
+    Supplier.objects.filter(supplier_code="").update(supplier_code=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("suppliers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_empty_values, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="supplier",
+            name="contact_name",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="supplier",
+            name="contact_email",
+            field=models.EmailField(blank=True, default="", max_length=254),
+        ),
+        migrations.AlterField(
+            model_name="supplier",
+            name="phone_number",
+            field=models.CharField(blank=True, default="", max_length=15),
+        ),
+        migrations.AlterField(
+            model_name="supplier",
+            name="address",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AlterField(
+            model_name="supplier",
+            name="supplier_code",
+            field=models.CharField(
+                blank=True, default=None, max_length=50, null=True, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="supplier",
+            name="payment_terms",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="supplier",
+            name="notes",
+            field=models.TextField(blank=True, default=""),
+        ),
+    ]
@@ -3,16 +3,17 @@ from django.db import models
 
 class Supplier(models.Model):
     name = models.CharField(max_length=100)
-    contact_name = models.CharField(max_length=100, blank=True, null=True, default="")
-    contact_email = models.EmailField(blank=True, null=True, default="")
-    phone_number = models.CharField(max_length=15, blank=True, null=True, default="")
-    address = models.TextField(blank=True, null=True, default="")
+    contact_name = models.CharField(max_length=100, blank=True, default="")
+    contact_email = models.EmailField(blank=True, default="")
+    phone_number = models.CharField(max_length=15, blank=True, default="")
+    address = models.TextField(blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
+    # NULL rather than "" when missing: unique indexes treat NULLs as distinct.
     supplier_code = models.CharField(
-        max_length=50, unique=True, blank=True, null=True, default=""
+        max_length=50, unique=True, blank=True, null=True, default=None
     )
-    payment_terms = models.CharField(max_length=100, blank=True, null=True, default="")
-    notes = models.TextField(blank=True, null=True, default="")
+    payment_terms = models.CharField(max_length=100, blank=True, default="")
+    notes = models.TextField(blank=True, default="")
 
     def __str__(self):
         """Returns the name of the supplier as its string representation.
@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-10-15 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0002_alter_transaction_transaction_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["product", "transaction_date"], name="tx_product_date_idx"
+            ),
+        ),
+    ]
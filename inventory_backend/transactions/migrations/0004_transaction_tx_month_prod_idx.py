@@ -0,0 +1,22 @@
+# Generated by Django 5.1 on 2026-10-15 13:45
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0003_transaction_tx_product_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                django.db.models.functions.datetime.TruncMonth("transaction_date"),
+                models.F("product"),
+                name="tx_month_prod_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1 on 2026-10-15 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0004_transaction_tx_month_prod_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="tx_product_date_idx",
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["product", "transaction_date", "quantity"],
+                name="tx_prod_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1 on 2026-10-15 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0005_covering_product_date_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["transaction_type", "transaction_date"],
+                name="tx_type_date_idx",
+            ),
+        ),
+    ]
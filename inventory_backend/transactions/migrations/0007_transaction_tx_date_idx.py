@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0006_transaction_tx_type_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["transaction_date"], name="tx_date_idx"),
+        ),
+    ]
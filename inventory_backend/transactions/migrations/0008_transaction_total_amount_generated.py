@@ -0,0 +1,31 @@
+# Generated by Django 5.1 on 2026-10-15 17:50
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0007_transaction_tx_date_idx"),
+    ]
+
+    # A regular column cannot be altered into a generated one, so it is dropped
+    # and re-added; the database recomputes every row's value.
+    operations = [
+        migrations.RemoveField(
+            model_name="transaction",
+            name="total_amount",
+        ),
+        migrations.AddField(
+            model_name="transaction",
+            name="total_amount",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F("unit_price"), "*", models.F("quantity")
+                ),
+                output_field=models.DecimalField(decimal_places=2, max_digits=10),
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1 on 2026-10-15 18:20
+
+import uuid
+
+import transactions.models
+from django.db import migrations, models
+from django.db.models import Q
+
+
+def fill_missing_transaction_ids(apps, schema_editor):
+    Transaction = apps.get_model("transactions", "Transaction")
+    missing = Transaction.objects.filter(
+        Q(transaction_id__isnull=True) | Q(transaction_id="")
+    )
+    for transaction in missing.only("pk"):
+        Transaction.objects.filter(pk=transaction.pk).update(
+            transaction_id=uuid.uuid4().hex
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0008_transaction_total_amount_generated"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_missing_transaction_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="transaction",
+            name="transaction_id",
+            field=models.CharField(
+                default=transactions.models.generate_transaction_id,
+                max_length=50,
+                unique=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1 on 2026-10-15 18:35
+
+from django.db import migrations, models
+
+
+def replace_nulls_with_empty_strings(apps, schema_editor):
+    Transaction = apps.get_model("transactions", "Transaction")
+    for field in ("customer_name", "weather_condition"):
+        Transaction.objects.filter(**{f"{field}__isnull": True}).update(**{field: ""})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0009_alter_transaction_transaction_id"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            replace_nulls_with_empty_strings, migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="customer_name",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="weather_condition",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Weather condition on transaction date",
+                max_length=50,
+            ),
+        ),
+    ]
@@ -1,7 +1,21 @@
+import uuid
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import TruncMonth
 from suppliers.models import Supplier
 
 
+def generate_transaction_id():
+    """Generates a unique transaction id for rows created without one.
+
+    Used as the default for `Transaction.transaction_id`, so concurrent and bulk inserts each get
+    a distinct value without a uniqueness lookup.
+
+    Returns:
+        str: A 32-character hexadecimal UUID."""
+    return uuid.uuid4().hex
+
+
 class Transaction(models.Model):
     TRANSACTION_TYPES = [("sale", "Sale"), ("purchase", "Purchase")]
     product = models.ForeignKey("products.Product", on_delete=models.CASCADE)
@@ -9,20 +23,23 @@ class Transaction(models.Model):
     quantity = models.IntegerField()
     transaction_date = models.DateTimeField()
     unit_price = models.DecimalField(max_digits=10, decimal_places=2, default=0.0)
-    total_amount = models.DecimalField(
-        max_digits=10, decimal_places=2, blank=True, null=True, default=0.0
+    # Computed and stored by the database, so bulk_create and raw inserts get it too.
+    total_amount = models.GeneratedField(
+        expression=F("unit_price") * F("quantity"),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
     )
-    customer_name = models.CharField(max_length=100, blank=True, null=True, default="")
+    customer_name = models.CharField(max_length=100, blank=True, default="")
     supplier = models.ForeignKey(
         Supplier, on_delete=models.SET_NULL, blank=True, null=True, default=None
     )
     transaction_id = models.CharField(
-        max_length=50, unique=True, blank=True, null=True, default=""
+        max_length=50, unique=True, default=generate_transaction_id
     )
     weather_condition = models.CharField(
         max_length=50,
         blank=True,
-        null=True,
+        default="",
         help_text="Weather condition on transaction date",
     )
     is_holiday = models.BooleanField(
@@ -43,17 +60,19 @@ class Transaction(models.Model):
 
     class Meta:
         db_table = "transactions"
+        indexes = [
+            # quantity is included so per-product date-range sums are index-only.
+            models.Index(
+                fields=["product", "transaction_date", "quantity"],
+                name="tx_prod_date_idx",
+            ),
+            models.Index(
+                TruncMonth("transaction_date"), "product", name="tx_month_prod_idx"
+            ),
+            models.Index(
+                fields=["transaction_type", "transaction_date"], name="tx_type_date_idx"
+            ),
+            # Date-range filters across all products and types.
+            models.Index(fields=["transaction_date"], name="tx_date_idx"),
+        ]
 
-    def save(self, *args, **kwargs):
-        """Calculates the total amount as unit_price multiplied by quantity and saves the model instance.
-
-        Overrides the default save method to ensure total_amount is updated before persisting the instance.
-
-        Args:
-            *args: Variable length argument list to pass to the superclass save method.
-            **kwargs: Arbitrary keyword arguments to pass to the superclass save method.
-
-        Returns:
-            None"""
-        self.total_amount = self.unit_price * self.quantity
-        super().save(*args, **kwargs)
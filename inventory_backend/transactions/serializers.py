@@ -2,6 +2,42 @@ from rest_framework import serializers
 from .models import Transaction
 
 class TransactionSerializer(serializers.ModelSerializer):
+    # DRF maps a GeneratedField to a plain ModelField, which would emit the Decimal
+    # as a float; declared explicitly it stays a "12.34" string.
+    total_amount = serializers.DecimalField(
+        max_digits=10, decimal_places=2, read_only=True
+    )
+
+    class Meta:
+        model = Transaction
+        fields = '__all__'
+
+
+class TransactionListSerializer(serializers.ModelSerializer):
+    """Compact representation used by the transaction list endpoint.
+
+    Covers only the columns TransactionViewSet loads with only() on that endpoint, plus the
+    product and supplier names from the joined rows."""
+
+    product_name = serializers.CharField(source="product.name", read_only=True)
+    # Sales have no supplier; allow_null keeps the key, as None, instead of dropping it.
+    supplier_name = serializers.CharField(
+        source="supplier.name", read_only=True, allow_null=True
+    )
+    total_amount = serializers.DecimalField(
+        max_digits=10, decimal_places=2, read_only=True
+    )
+
     class Meta:
         model = Transaction
-        fields = '__all__'
\ No newline at end of file
+        fields = [
+            "id",
+            "product",
+            "product_name",
+            "transaction_type",
+            "quantity",
+            "transaction_date",
+            "total_amount",
+            "supplier",
+            "supplier_name",
+        ]
@@ -1,3 +1,159 @@
+from datetime import datetime, timezone as dt_timezone
 from django.test import TestCase
+from rest_framework import status
+from inventory_logs.models import InventoryLog
+from products.factories import ProductFactory
+from products.models import Product, ProductDailyDemand
+from .models import Transaction
 
-# Create your tests here.
+
+class TransactionBulkCreateTest(TestCase):
+    url = "/api/transactions/"
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates the product the posted transactions refer to.
+
+        Attributes set:
+            cls.product: The Product instance used for testing, starting with 100 units."""
+        cls.product = ProductFactory(stock_level=100)
+
+    def _transaction(self, transaction_type, quantity, transaction_id):
+        return {
+            "product": self.product.id,
+            "transaction_type": transaction_type,
+            "quantity": quantity,
+            "unit_price": "2.00",
+            "transaction_date": "2026-01-31T09:00:00Z",
+            "transaction_id": transaction_id,
+        }
+
+    def test_list_body_creates_every_transaction(self):
+        """A list body creates all transactions, returns them with their ids, nets their stock changes and logs each one."""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                [
+                    self._transaction("sale", 3, "TXN-1"),
+                    self._transaction("purchase", 10, "TXN-2"),
+                ],
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        created = Transaction.objects.filter(product=self.product).order_by("id")
+        self.assertEqual(
+            [row["id"] for row in response.json()],
+            list(created.values_list("id", flat=True)),
+        )
+        self.assertEqual(
+            [row["total_amount"] for row in response.json()], ["6.00", "20.00"]
+        )
+        self.assertEqual(created.count(), 2)
+        self.assertEqual(Product.objects.get(pk=self.product.pk).stock_level, 107)
+        self.assertEqual(InventoryLog.objects.filter(product=self.product).count(), 2)
+        self.assertEqual(
+            ProductDailyDemand.objects.get(product=self.product).quantity, 13
+        )
+
+    def test_invalid_item_rejects_whole_batch(self):
+        """One invalid transaction fails validation for the batch and nothing is written."""
+        response = self.client.post(
+            self.url,
+            [
+                self._transaction("sale", 3, "TXN-1"),
+                self._transaction("refund", 1, "TXN-2"),
+            ],
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Transaction.objects.filter(product=self.product).exists())
+
+    def test_repeated_transaction_id_rejects_whole_batch(self):
+        """Two items with the same transaction_id fail with HTTP 400 instead of an INSERT error."""
+        response = self.client.post(
+            self.url,
+            [
+                self._transaction("sale", 3, "TXN-1"),
+                self._transaction("sale", 1, "TXN-1"),
+            ],
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("transaction_id", response.json()[1])
+        self.assertFalse(Transaction.objects.filter(product=self.product).exists())
+
+
+class TransactionCreateTest(TestCase):
+    url = "/api/transactions/"
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates the product the posted transaction refers to.
+
+        Attributes set:
+            cls.product: The Product instance used for testing, starting with 100 units."""
+        cls.product = ProductFactory(stock_level=100)
+
+    def _post_sale(self, quantity):
+        return self.client.post(
+            self.url,
+            {
+                "product": self.product.id,
+                "transaction_type": "sale",
+                "quantity": quantity,
+                "unit_price": "2.00",
+                "transaction_date": "2026-01-31T09:00:00Z",
+                "transaction_id": "TXN-1",
+            },
+            content_type="application/json",
+        )
+
+    def test_sale_reduces_stock_and_is_logged(self):
+        """A single sale lowers the product's stock in place and logs it once the request commits."""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self._post_sale(4)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Product.objects.get(pk=self.product.pk).stock_level, 96)
+        log = InventoryLog.objects.get(product=self.product)
+        self.assertEqual(log.stock_change, -4)
+        self.assertEqual(log.reason_code, "sale")
+        self.assertEqual(log.description, "Sale of 4 units")
+
+    def test_sale_refreshes_cached_product_list(self):
+        """A cached product list shows the new stock level after a sale."""
+        self.client.get("/api/products/")
+        self._post_sale(4)
+        products = self.client.get("/api/products/").json()
+        self.assertEqual(products[0]["stock_level"], 96)
+
+
+class TransactionListTest(TestCase):
+    url = "/api/transactions/"
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates three transactions for one product.
+
+        Attributes set:
+            cls.product: The Product instance the transactions belong to."""
+        cls.product = ProductFactory(name="Listed Product")
+        for day in range(1, 4):
+            Transaction.objects.create(
+                product=cls.product,
+                transaction_type="sale",
+                quantity=day,
+                transaction_date=datetime(2026, 1, day, 9, tzinfo=dt_timezone.utc),
+                transaction_id=f"TXN-{day}",
+            )
+
+    def test_list_is_paginated_newest_first(self):
+        """The list endpoint honours limit/offset and returns the compact representation."""
+        response = self.client.get(self.url, {"limit": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body["count"], 3)
+        self.assertEqual([row["quantity"] for row in body["results"]], [3, 2])
+        self.assertEqual(body["results"][0]["product_name"], "Listed Product")
+        self.assertEqual(body["results"][0]["total_amount"], "0.00")
+        self.assertIsNone(body["results"][0]["supplier_name"])
+        self.assertNotIn("customer_name", body["results"][0])
@@ -1,14 +1,172 @@
+from collections import Counter
+from datetime import timezone as dt_timezone
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.db.models import Case, F, IntegerField, Value, When
 from rest_framework import viewsets, status
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from .models import Transaction
-from .serializers import TransactionSerializer
-from products.models import Product
+from .serializers import TransactionListSerializer, TransactionSerializer
+from products.models import Product, ProductDailyDemand, ProductTransactionTotals
+from products.signals import invalidate_product_list
 from inventory_logs.models import InventoryLog
 
 
+def _stock_change(transaction):
+    """Returns the signed stock change of a transaction and the reason code logged for it.
+
+    Args:
+        transaction (Transaction): A sale or purchase.
+
+    Returns:
+        tuple: (stock_change, reason_code); sales reduce stock and purchases add to it."""
+    if transaction.transaction_type == "purchase":
+        return transaction.quantity, "purchase"
+    return -transaction.quantity, "sale"
+
+
+class TransactionPagination(LimitOffsetPagination):
+    default_limit = 100
+    max_limit = 1000
+
+
 class TransactionViewSet(viewsets.ModelViewSet):
-    queryset = Transaction.objects.all()
+    queryset = Transaction.objects.select_related("product", "supplier")
     serializer_class = TransactionSerializer
+    pagination_class = TransactionPagination
+
+    def get_queryset(self):
+        """Returns the transactions, loading only the listed columns on the list endpoint.
+
+        The foreign key columns stay in the projection so the joined product and supplier rows
+        are matched without extra queries.
+
+        Returns:
+            QuerySet: The transactions with their product and supplier joined."""
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.only(
+                "id",
+                "transaction_type",
+                "quantity",
+                "transaction_date",
+                "total_amount",
+                "product_id",
+                "product__name",
+                "supplier_id",
+                "supplier__name",
+            ).order_by("-transaction_date", "-id")
+        return queryset
+
+    def get_serializer_class(self):
+        """Returns the compact list serializer on the list endpoint and the full one elsewhere."""
+        if self.action == "list":
+            return TransactionListSerializer
+        return TransactionSerializer
+
+    def create(self, request, *args, **kwargs):
+        """Creates one transaction, or a whole batch when the request body is a JSON list.
+
+        A batch is validated as a unit and written with one bulk INSERT for the transactions and
+        one UPDATE for every affected product's stock level inside a single database transaction;
+        the inventory log rows follow in one bulk INSERT once it commits. The daily demand and
+        dashboard totals rows are recomputed with one grouped aggregate and one upsert each.
+
+        Args:
+            request (Request): The HTTP request; its body is one transaction or a list of them.
+            *args: Positional arguments passed on to ModelViewSet.create.
+            **kwargs: Keyword arguments passed on to ModelViewSet.create.
+
+        Returns:
+            Response: HTTP 201 with the created transaction(s), or HTTP 400 with validation errors,
+                including transaction_ids repeated within the batch."""
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        # UniqueValidator only checks stored rows, so repeats within the batch are
+        # caught here instead of failing the INSERT.
+        id_counts = Counter(
+            attrs["transaction_id"]
+            for attrs in serializer.validated_data
+            if "transaction_id" in attrs
+        )
+        if any(count > 1 for count in id_counts.values()):
+            return Response(
+                [
+                    (
+                        {"transaction_id": ["Duplicate transaction_id in this batch."]}
+                        if id_counts[attrs.get("transaction_id")] > 1
+                        else {}
+                    )
+                    for attrs in serializer.validated_data
+                ],
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        transactions = [Transaction(**attrs) for attrs in serializer.validated_data]
+        batch_size = settings.STORER_BULK_BATCH_SIZE
+        changes = [_stock_change(transaction) for transaction in transactions]
+        stock_deltas = {}
+        for transaction, (stock_change, _) in zip(transactions, changes):
+            stock_deltas[transaction.product_id] = (
+                stock_deltas.get(transaction.product_id, 0) + stock_change
+            )
+        with db_transaction.atomic():
+            Transaction.objects.bulk_create(transactions, batch_size=batch_size)
+            Product.objects.filter(id__in=stock_deltas).update(
+                stock_level=F("stock_level")
+                + Case(
+                    *(
+                        When(id=product_id, then=Value(delta))
+                        for product_id, delta in stock_deltas.items()
+                    ),
+                    output_field=IntegerField(),
+                )
+            )
+            inventory_logs = [
+                InventoryLog(
+                    product_id=transaction.product_id,
+                    stock_change=stock_change,
+                    reason_code=reason_code,
+                )
+                for transaction, (stock_change, reason_code) in zip(
+                    transactions, changes
+                )
+            ]
+            # Flushed after commit so the audit INSERT does not extend the time the
+            # product rows stay locked by the stock UPDATE.
+            db_transaction.on_commit(
+                lambda: InventoryLog.objects.bulk_create(
+                    inventory_logs, batch_size=batch_size
+                )
+            )
+            # bulk_create skips the Transaction signals that maintain these tables.
+            days = {
+                (
+                    transaction.product_id,
+                    transaction.transaction_date.astimezone(dt_timezone.utc).date(),
+                )
+                for transaction in transactions
+            }
+            ProductDailyDemand.objects.refresh_many(days)
+            ProductTransactionTotals.objects.refresh_many(stock_deltas)
+        invalidate_product_list()
+        # MySQL's bulk INSERT does not return primary keys and the database computes
+        # total_amount, so the response is built from the stored rows.
+        created = (
+            self.get_queryset()
+            .filter(
+                transaction_id__in=[
+                    transaction.transaction_id for transaction in transactions
+                ]
+            )
+            .order_by("id")
+        )
+        return Response(
+            self.get_serializer(created, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
 
     def perform_create(self, serializer):
         """Creates a new transaction, updates the related product's stock level accordingly, and logs the inventory change.
@@ -19,20 +177,20 @@ class TransactionViewSet(viewsets.ModelViewSet):
         Returns:
             None
 
-        This method is typically called during the creation of a transaction record. It adjusts the product's stock level by decreasing it for sales and increasing it for purchases, then saves the updated product state. An InventoryLog entry is created to record the stock change and its reason."""
+        This method is typically called during the creation of a transaction record. It adjusts the product's stock level by decreasing it for sales and increasing it for purchases with a single atomic UPDATE, so concurrent transactions on the same product cannot overwrite each other's change. The InventoryLog entry recording the stock change and its reason code is written once the request's database transaction commits."""
         transaction = serializer.save()
-        product = transaction.product
-        if transaction.transaction_type == "sale":
-            product.stock_level -= transaction.quantity
-            reason = f"Sale of {transaction.quantity} units"
-        elif transaction.transaction_type == "purchase":
-            product.stock_level += transaction.quantity
-            reason = f"Purchase of {transaction.quantity} units"
-        product.save()
-        InventoryLog.objects.create(
-            product=product,
-            stock_change=transaction.quantity
-            if transaction.transaction_type == "purchase"
-            else -transaction.quantity,
-            reason=reason,
+        stock_change, reason_code = _stock_change(transaction)
+        Product.objects.filter(pk=transaction.product_id).update(
+            stock_level=F("stock_level") + stock_change
+        )
+        # The UPDATE bypasses the Product signals that drop cached product lists.
+        invalidate_product_list()
+        # The audit row is not part of the response, so it is written after commit
+        # and stays out of the transaction that holds the product row lock.
+        db_transaction.on_commit(
+            lambda: InventoryLog.objects.create(
+                product_id=transaction.product_id,
+                stock_change=stock_change,
+                reason_code=reason_code,
+            )
         )
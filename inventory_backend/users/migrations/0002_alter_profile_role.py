@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-15 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="profile",
+            name="role",
+            field=models.CharField(
+                choices=[("admin", "Admin"), ("staff", "Staff")],
+                db_index=True,
+                default="staff",
+                max_length=10,
+            ),
+        ),
+    ]
@@ -2,10 +2,21 @@ from django.db import models
 from django.contrib.auth.models import User
 
 
+class ProfileManager(models.Manager):
+    def get_queryset(self):
+        """Joins the auth user into every profile query, since __str__ reads its username.
+
+        Returns:
+            QuerySet: Profiles with their user loaded in the same query."""
+        return super().get_queryset().select_related("user")
+
+
 class Profile(models.Model):
     ROLES = [("admin", "Admin"), ("staff", "Staff")]
     user = models.OneToOneField(User, on_delete=models.CASCADE)
-    role = models.CharField(max_length=10, choices=ROLES, default="staff")
+    role = models.CharField(max_length=10, choices=ROLES, default="staff", db_index=True)
+
+    objects = ProfileManager()
 
     def __str__(self):
         """Return the username of the associated user.
@@ -1,44 +1,63 @@
+import pandas as pd
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE_URL = "http://localhost:8000/api/products/"
 st.title("Inventory Management Prototype")
 
 
+@st.cache_resource
+def get_session():
+    """Returns the HTTP session shared by every rerun, so API calls reuse kept-alive connections.
+
+    Idempotent requests are retried up to three times with a short backoff; POSTs are not retried.
+
+    Args:
+        None
+
+    Returns:
+        requests.Session: The shared session."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=30)
 def fetch_products():
-    """Fetches product data from the API and displays product details in a Streamlit app.
+    """Fetches the product list from the API.
 
-    Makes a GET request to the configured API endpoint to retrieve a list of products.
-    For each product, its name, description, price, and stock level are displayed using
-    Streamlit components. If the product list is empty or the API request fails, an
-    informative message is shown in the app.
+    The parsed list is cached for 30 seconds, so the reruns Streamlit performs on every widget
+    interaction do not each issue a request. Adding a product clears the cache.
 
     Args:
         None
 
     Returns:
-        None"""
-    response = requests.get(API_BASE_URL)
-    if response.status_code == 200:
-        products = response.json()
-        if products:
-            for product in products:
-                st.write(f"**Name:** {product['name']}")
-                st.write(f"Description: {product['description']}")
-                st.write(f"Price: ${product['price']}")
-                st.write(f"Stock Level: {product['stock_level']}")
-                st.write("---")
-        else:
-            st.info("No products found.")
-    else:
-        st.error("Failed to fetch products")
+        list: The products as returned by the API.
+
+    Raises:
+        requests.RequestException: If the request fails or returns an error status; failures
+            are not cached."""
+    response = get_session().get(API_BASE_URL)
+    response.raise_for_status()
+    return response.json()
 
 
 def display_product_list():
     """Display the current list of products in a Streamlit container.
 
-    Creates a Streamlit container with a subheader titled "Current Products" and populates it
-    by calling the `fetch_products()` function to retrieve and display the product data.
+    Creates a Streamlit container with a subheader titled "Current Products" and shows each
+    product's name, description, price, and stock level from `fetch_products()` in a single
+    table, so the whole list is sent to the browser in one element. If the product list is empty
+    or the API request fails, an informative message is shown instead.
 
     Args:
         None
@@ -47,13 +66,26 @@ def display_product_list():
         None"""
     with st.container():
         st.subheader("Current Products")
-        fetch_products()
+        try:
+            products = fetch_products()
+        except requests.RequestException:
+            st.error("Failed to fetch products")
+            return
+        if products:
+            st.dataframe(
+                pd.DataFrame(products)[["name", "description", "price", "stock_level"]],
+                use_container_width=True,
+                hide_index=True,
+            )
+        else:
+            st.info("No products found.")
 
 
 placeholder = st.empty()
 with placeholder.container():
     display_product_list()
 if st.button("Update Stock List"):
+    fetch_products.clear()
     placeholder.empty()
     with placeholder.container():
         display_product_list()
@@ -69,9 +101,10 @@ if st.button("Add Product"):
         "price": price,
         "stock_level": stock_level,
     }
-    response = requests.post(API_BASE_URL, json=product_data)
+    response = get_session().post(API_BASE_URL, json=product_data)
     if response.status_code == 201:
         st.success("Product added successfully!")
+        fetch_products.clear()
         placeholder.empty()
         with placeholder.container():
             display_product_list()